@@ -2,6 +2,7 @@ from typing import Dict, List, Optional
 import logging
 import random
 import requests
+import threading
 import time
 from pathlib import Path
 import json
@@ -13,6 +14,12 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Consecutive failures before a proxy is taken out of rotation
+PROXY_FAILURE_THRESHOLD = 3
+
+# Seconds a failing proxy stays out of rotation
+PROXY_COOLDOWN = 300
+
 class ProxyManager:
     """Service for managing proxy rotation."""
     
@@ -24,6 +31,11 @@ class ProxyManager:
         self.proxy_type = None  # 'static', 'tor', or None
         self.last_rotation = 0
         self.rotation_interval = 300  # 5 minutes
+        
+        # Circuit breaker state, keyed by proxy URL
+        self.failure_counts: Dict[str, int] = {}
+        self.cold_until: Dict[str, float] = {}
+        self._breaker_lock = threading.Lock()
     
     def _load_static_proxies(self) -> List[Dict[str, str]]:
         """Load static residential proxies from configuration.
@@ -69,19 +81,38 @@ class ProxyManager:
         
         return self.current_proxy
     
+    def _available(self, proxies: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Filter out proxies whose circuit breaker is open.
+        
+        Args:
+            proxies: Proxy dictionaries to filter
+            
+        Returns:
+            Proxies currently allowed in rotation, or all of them if every
+            proxy is cooling down
+        """
+        now = time.time()
+        with self._breaker_lock:
+            available = [p for p in proxies if self.cold_until.get(p.get("http"), 0) <= now]
+        
+        # Never go without a proxy just because every one is cooling down
+        return available or proxies
+    
     def rotate_proxy(self) -> None:
         """Rotate to a new proxy."""
         # Try static proxies first
-        if self.static_proxies:
-            self.current_proxy = random.choice(self.static_proxies)
+        static_proxies = self._available(self.static_proxies)
+        if static_proxies:
+            self.current_proxy = random.choice(static_proxies)
             self.proxy_type = "static"
             logger.info("Rotated to static proxy")
             self.last_rotation = time.time()
             return
         
         # Fall back to Tor
-        if self.tor_proxies:
-            self.current_proxy = random.choice(self.tor_proxies)
+        tor_proxies = self._available(self.tor_proxies)
+        if tor_proxies:
+            self.current_proxy = random.choice(tor_proxies)
             self.proxy_type = "tor"
             logger.info("Rotated to Tor proxy")
             self.last_rotation = time.time()
@@ -92,6 +123,42 @@ class ProxyManager:
         self.proxy_type = None
         logger.warning("No proxies available")
     
+    def record_failure(self, proxy: Optional[Dict[str, str]]) -> None:
+        """Record a failed request through a proxy.
+        
+        After PROXY_FAILURE_THRESHOLD consecutive failures the proxy is
+        kept out of rotation for PROXY_COOLDOWN seconds.
+        
+        Args:
+            proxy: Proxy the request went through, or None for a direct request
+        """
+        if proxy is None:
+            return
+        
+        key = proxy.get("http")
+        with self._breaker_lock:
+            failures = self.failure_counts.get(key, 0) + 1
+            tripped = failures >= PROXY_FAILURE_THRESHOLD
+            if tripped:
+                self.cold_until[key] = time.time() + PROXY_COOLDOWN
+                failures = 0
+            self.failure_counts[key] = failures
+        
+        if tripped:
+            logger.warning(f"Proxy failed {PROXY_FAILURE_THRESHOLD} times, cooling down for {PROXY_COOLDOWN} seconds")
+    
+    def record_success(self, proxy: Optional[Dict[str, str]]) -> None:
+        """Record a successful request through a proxy.
+        
+        Args:
+            proxy: Proxy the request went through, or None for a direct request
+        """
+        if proxy is None:
+            return
+        
+        with self._breaker_lock:
+            self.failure_counts.pop(proxy.get("http"), None)
+    
     def test_proxy(self, proxy: Dict[str, str]) -> bool:
         """Test if a proxy is working.
         
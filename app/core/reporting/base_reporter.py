@@ -1,14 +1,116 @@
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, TextIO, Union
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from io import BytesIO, StringIO
+from operator import itemgetter
 import pandas as pd
 import plotly.graph_objects as go
-from weasyprint import HTML
+import plotly.io as pio
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 import openpyxl
-from decimal import Decimal
+import orjson
+import xxhash
+from cachetools import TTLCache
+import xlsxwriter
+from jinja2 import Environment
 
 logger = logging.getLogger(__name__)
 
+# Serialize figures with orjson instead of the stdlib json encoder
+pio.json.config.default_engine = 'orjson'
+
+# Plotly.js bundle matching the pinned plotly release, loaded once per page
+PLOTLY_JS_URL = "https://cdn.plot.ly/plotly-2.27.0.min.js"
+
+# Rendered reports are reused for identical requests within this window
+REPORT_CACHE_SIZE = 256
+REPORT_CACHE_TTL = 60  # seconds
+
+# Report type and format pairs whose builder can write to a text stream
+STREAMABLE_REPORTS = frozenset({('daily_opportunity', 'dashboard')})
+
+# Above this many rows Excel reports are streamed with xlsxwriter
+EXCEL_STREAMING_THRESHOLD = 1000
+
+# Row accessors for opportunity report tables
+_OPP_GET = itemgetter('item', 'current_price', 'estimated_value', 'potential_profit')
+_RISK_REWARD_GET = itemgetter('risk', 'reward')
+_BUDGET_GET = itemgetter('amount', 'percentage')
+
+# HTML templates, compiled once and autoescaped
+_TEMPLATE_ENV = Environment(autoescape=True)
+
+OPPORTUNITY_EMAIL_TEMPLATE = _TEMPLATE_ENV.from_string("""
+<!DOCTYPE html>
+<html>
+    <head>
+        <title>Daily Opportunity Report</title>
+        <style>
+            body { font-family: Arial, sans-serif; }
+            table { border-collapse: collapse; width: 100%; margin-bottom: 20px; }
+            th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+            th { background-color: #f5f5f5; }
+            .summary { margin-bottom: 20px; }
+        </style>
+    </head>
+    <body>
+        <h1>Daily Opportunity Report</h1>
+        
+        <div class="summary">
+            <h2>Top Opportunities</h2>
+            <table>
+                <tr>
+                    <th>Item</th>
+                    <th>Current Price</th>
+                    <th>Estimated Value</th>
+                    <th>Potential Profit</th>
+                </tr>
+                {% for opp in opportunities %}<tr><td>{{ opp.item }}</td><td>${{ opp.current_price }}</td><td>${{ opp.estimated_value }}</td><td>${{ opp.potential_profit }}</td></tr>{% endfor %}
+            </table>
+        </div>
+        
+        <div class="summary">
+            <h2>Risk/Reward Summary</h2>
+            <table>
+                <tr>
+                    <th>Category</th>
+                    <th>Risk Score</th>
+                    <th>Reward Score</th>
+                </tr>
+                {% for category, scores in risk_reward.items() %}<tr><td>{{ category }}</td><td>{{ scores.risk }}</td><td>{{ scores.reward }}</td></tr>{% endfor %}
+            </table>
+        </div>
+        
+        <div class="summary">
+            <h2>Budget Allocation</h2>
+            <table>
+                <tr>
+                    <th>Category</th>
+                    <th>Amount</th>
+                    <th>Percentage</th>
+                </tr>
+                {% for category, values in budget.items() %}<tr><td>{{ category }}</td><td>${{ values.amount }}</td><td>{{ values.percentage }}%</td></tr>{% endfor %}
+            </table>
+        </div>
+        
+        <p>View the full report in your dashboard for more details.</p>
+    </body>
+</html>
+""")
+
+# Shared style for tabular PDF reports
+PDF_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP')
+])
+
 class BaseReporter:
     """Base class for report generation."""
     
@@ -21,47 +123,167 @@ class BaseReporter:
         }
         
         self.output_formats = ['dashboard', 'pdf', 'excel', 'email']
+        
+        # Dispatch tables for report types and their per-format builders
+        self._generators = {
+            'daily_opportunity': self._generate_daily_opportunity,
+            'post_auction': self._generate_post_auction,
+            'tax_prep': self._generate_tax_prep
+        }
+        self._builders = {
+            report_type: {
+                format: getattr(self, f'_create_{prefix}_{format}', None)
+                for format in self.output_formats
+            }
+            for report_type, prefix in (
+                ('daily_opportunity', 'opportunity'),
+                ('post_auction', 'post_auction'),
+                ('tax_prep', 'tax_prep')
+            )
+        }
+        
+        # Rendered reports keyed by (report_type, format, data hash)
+        self._cache = TTLCache(maxsize=REPORT_CACHE_SIZE, ttl=REPORT_CACHE_TTL)
+        self._cache_lock = threading.Lock()
+    
+    def _get_builder(self, report_type: str, format: str) -> Optional[Callable]:
+        """Look up the builder for a report type and output format.
+        
+        Args:
+            report_type: Type of report
+            format: Output format
+            
+        Returns:
+            Bound builder method, or None if not available
+        """
+        builder = self._builders[report_type].get(format)
+        if builder is None:
+            logger.error(f"No {format} builder for {report_type} reports")
+        return builder
     
-    def generate_report(self, report_type: str, data: Dict, format: str = 'dashboard') -> Union[str, bytes]:
+    def generate_report(self, report_type: str, data: Dict, format: str = 'dashboard',
+                        out: Optional[TextIO] = None) -> Union[str, bytes]:
         """Generate a report.
         
         Args:
             report_type: Type of report to generate
             data: Data for the report
             format: Output format
+            out: Optional text stream to write the report to; only
+                STREAMABLE_REPORTS support it
             
         Returns:
-            Report in requested format
+            Report in requested format, or None when written to ``out``
         """
         try:
             if format not in self.output_formats:
                 logger.error(f"Invalid output format: {format}")
                 return None
             
+            if out is not None and (report_type, format) not in STREAMABLE_REPORTS:
+                logger.error(f"{report_type} {format} reports cannot be written to a stream")
+                return None
+            
             # Generate report based on type
-            if report_type == 'daily_opportunity':
-                return self._generate_daily_opportunity(data, format)
-            elif report_type == 'post_auction':
-                return self._generate_post_auction(data, format)
-            elif report_type == 'tax_prep':
-                return self._generate_tax_prep(data, format)
-            else:
+            generator = self._generators.get(report_type)
+            if generator is None:
                 logger.error(f"Invalid report type: {report_type}")
                 return None
+            
+            # Serve identical recent requests from the cache
+            key = self._cache_key(report_type, format, data)
+            if key is not None:
+                with self._cache_lock:
+                    cached = self._cache.get(key)
+                if cached is not None:
+                    if out is None:
+                        return cached
+                    out.write(cached)
+                    return None
+            
+            # Streamed reports are never held whole, so they are not cached
+            if out is not None:
+                return generator(data, format, out=out)
+            
+            report = generator(data, format)
+            
+            if key is not None and report is not None:
+                with self._cache_lock:
+                    self._cache[key] = report
+            
+            return report
                 
         except Exception as e:
             logger.error(f"Report generation failed: {e}")
             return None
     
-    def _generate_daily_opportunity(self, data: Dict, format: str) -> Union[str, bytes]:
+    def _cache_key(self, report_type: str, format: str, data: Dict) -> Optional[tuple]:
+        """Build the report cache key for a request.
+        
+        Args:
+            report_type: Type of report
+            format: Output format
+            data: Data for the report
+            
+        Returns:
+            Cache key, or None if the data cannot be hashed
+        """
+        try:
+            # DataFrames are derived from the other entries, so skip them
+            payload = orjson.dumps(
+                {k: v for k, v in data.items() if not isinstance(v, pd.DataFrame)},
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                default=str
+            )
+            return (report_type, format, xxhash.xxh64(payload).intdigest())
+            
+        except Exception as e:
+            logger.warning(f"Report data not cacheable: {e}")
+            return None
+    
+    def generate_all(self, report_type: str, data: Dict, formats: Optional[List[str]] = None) -> Dict[str, Union[str, bytes]]:
+        """Generate a report in several formats concurrently.
+        
+        Every format is rendered from the same data dict; the formats
+        share no rendered fragments, since each builds its own tables.
+        
+        Args:
+            report_type: Type of report to generate
+            data: Data for the report
+            formats: Output formats (defaults to all supported formats)
+            
+        Returns:
+            Mapping of format to report
+        """
+        try:
+            formats = formats or self.output_formats
+            
+            # The builders are mostly pure Python and hold the GIL, so
+            # threads only overlap the parts that release it, such as the
+            # zlib compression of Excel workbooks
+            with ThreadPoolExecutor(max_workers=min(len(formats), 4)) as executor:
+                futures = {
+                    format: executor.submit(self.generate_report, report_type, data, format)
+                    for format in formats
+                }
+                
+            return {format: future.result() for format, future in futures.items()}
+            
+        except Exception as e:
+            logger.error(f"Batch report generation failed: {e}")
+            return {}
+    
+    def _generate_daily_opportunity(self, data: Dict, format: str,
+                                    out: Optional[TextIO] = None) -> Union[str, bytes]:
         """Generate daily opportunity report.
         
         Args:
             data: Report data
             format: Output format
+            out: Optional text stream to write the dashboard to
             
         Returns:
-            Report in requested format
+            Report in requested format, or None when written to ``out``
         """
         try:
             # Extract data
@@ -69,15 +291,17 @@ class BaseReporter:
             risk_reward = data.get('risk_reward', {})
             budget = data.get('budget', {})
             
+            builder = self._get_builder('daily_opportunity', format)
+            if builder is None:
+                return None
+            
+            # Reuse the DataFrame built while processing the opportunities
             if format == 'dashboard':
-                return self._create_opportunity_dashboard(opportunities, risk_reward, budget)
-            elif format == 'pdf':
-                return self._create_opportunity_pdf(opportunities, risk_reward, budget)
-            elif format == 'excel':
-                return self._create_opportunity_excel(opportunities, risk_reward, budget)
-            elif format == 'email':
-                return self._create_opportunity_email(opportunities, risk_reward, budget)
-                
+                return builder(opportunities, risk_reward, budget, out=out,
+                               opportunities_df=data.get('opportunities_df'))
+            
+            return builder(opportunities, risk_reward, budget)
+            
         except Exception as e:
             logger.error(f"Daily opportunity report generation failed: {e}")
             return None
@@ -98,15 +322,9 @@ class BaseReporter:
             performance = data.get('performance', {})
             patterns = data.get('patterns', {})
             
-            if format == 'dashboard':
-                return self._create_post_auction_dashboard(summary, performance, patterns)
-            elif format == 'pdf':
-                return self._create_post_auction_pdf(summary, performance, patterns)
-            elif format == 'excel':
-                return self._create_post_auction_excel(summary, performance, patterns)
-            elif format == 'email':
-                return self._create_post_auction_email(summary, performance, patterns)
-                
+            builder = self._get_builder('post_auction', format)
+            return builder(summary, performance, patterns) if builder else None
+            
         except Exception as e:
             logger.error(f"Post-auction report generation failed: {e}")
             return None
@@ -127,70 +345,81 @@ class BaseReporter:
             inventory = data.get('inventory', {})
             sales_tax = data.get('sales_tax', {})
             
-            if format == 'dashboard':
-                return self._create_tax_prep_dashboard(fees, inventory, sales_tax)
-            elif format == 'pdf':
-                return self._create_tax_prep_pdf(fees, inventory, sales_tax)
-            elif format == 'excel':
-                return self._create_tax_prep_excel(fees, inventory, sales_tax)
-            elif format == 'email':
-                return self._create_tax_prep_email(fees, inventory, sales_tax)
-                
+            builder = self._get_builder('tax_prep', format)
+            return builder(fees, inventory, sales_tax) if builder else None
+            
         except Exception as e:
             logger.error(f"Tax preparation report generation failed: {e}")
             return None
     
-    def _create_opportunity_dashboard(self, opportunities: List[Dict], risk_reward: Dict, budget: Dict) -> str:
+    def _create_opportunity_dashboard(self, opportunities: List[Dict], risk_reward: Dict, budget: Dict,
+                                      out: Optional[TextIO] = None,
+                                      opportunities_df: Optional[pd.DataFrame] = None) -> Optional[str]:
         """Create interactive dashboard for daily opportunities.
         
         Args:
             opportunities: List of opportunities
             risk_reward: Risk/reward matrix
             budget: Budget allocation
+            out: Optional text stream to write the dashboard to
+            opportunities_df: Optional prebuilt DataFrame of the opportunities
             
         Returns:
-            HTML dashboard
+            HTML dashboard, or None when written to ``out``
         """
         try:
-            # Create opportunity table
-            df = pd.DataFrame(opportunities)
-            fig = go.Figure(data=[go.Table(
-                header=dict(values=list(df.columns)),
-                cells=dict(values=[df[col] for col in df.columns])
-            )])
+            # Create opportunity table; static data needs no plotly runtime
+            df = opportunities_df if opportunities_df is not None else pd.DataFrame.from_records(opportunities)
+            opportunity_table = df.to_html(index=False, border=0, classes='opp-table', escape=True)
             
-            # Create risk/reward scatter plot
-            risk_reward_df = pd.DataFrame(risk_reward)
+            # Create risk/reward scatter plot, one point per category
+            scores = risk_reward.values()
             fig2 = go.Figure(data=[go.Scatter(
-                x=risk_reward_df['risk'],
-                y=risk_reward_df['reward'],
+                x=[v['risk'] for v in scores],
+                y=[v['reward'] for v in scores],
+                text=list(risk_reward),
                 mode='markers'
             )])
             
             # Create budget allocation pie chart
-            budget_df = pd.DataFrame(budget)
             fig3 = go.Figure(data=[go.Pie(
-                labels=budget_df['category'],
-                values=budget_df['amount']
+                labels=list(budget),
+                values=[v['amount'] for v in budget.values()]
             )])
             
-            # Combine into dashboard
-            dashboard = f"""
+            # Emit chart fragments only; plotly.js is loaded once in the head
+            fragment = dict(full_html=False, include_plotlyjs=False)
+            
+            # Write the dashboard piece by piece so the full page is never
+            # held as one string when streaming to a response
+            buffer = out if out is not None else StringIO()
+            buffer.write(f"""
             <html>
                 <head>
                     <title>Daily Opportunity Report</title>
-                    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+                    <script src="{PLOTLY_JS_URL}"></script>
+                    <style>
+                        .opp-table {{ border-collapse: collapse; width: 100%; }}
+                        .opp-table th, .opp-table td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+                        .opp-table th {{ background-color: #f5f5f5; }}
+                    </style>
                 </head>
                 <body>
                     <h1>Daily Opportunity Report</h1>
-                    <div id="opportunities">{fig.to_html()}</div>
-                    <div id="risk_reward">{fig2.to_html()}</div>
-                    <div id="budget">{fig3.to_html()}</div>
+                    <div id="opportunities">
+            """)
+            buffer.write(opportunity_table)
+            buffer.write('</div>')
+            for div_id, figure in (('risk_reward', fig2), ('budget', fig3)):
+                buffer.write(f'<div id="{div_id}">')
+                buffer.write(figure.to_html(div_id=f'{div_id}_chart', **fragment))
+                buffer.write('</div>')
+            buffer.write("""
                 </body>
             </html>
-            """
+            """)
             
-            return dashboard
+            return buffer.getvalue() if out is None else None
             
         except Exception as e:
             logger.error(f"Dashboard creation failed: {e}")
@@ -208,55 +437,45 @@ class BaseReporter:
             PDF bytes
         """
         try:
-            # Create HTML content
-            html_content = f"""
-            <html>
-                <head>
-                    <title>Daily Opportunity Report</title>
-                    <style>
-                        table {{ border-collapse: collapse; width: 100%; }}
-                        th, td {{ border: 1px solid black; padding: 8px; text-align: left; }}
-                        th {{ background-color: #f2f2f2; }}
-                    </style>
-                </head>
-                <body>
-                    <h1>Daily Opportunity Report</h1>
-                    <h2>Top Opportunities</h2>
-                    <table>
-                        <tr>
-                            <th>Item</th>
-                            <th>Current Price</th>
-                            <th>Estimated Value</th>
-                            <th>Potential Profit</th>
-                        </tr>
-                        {''.join(f"<tr><td>{opp['item']}</td><td>${opp['current_price']}</td><td>${opp['estimated_value']}</td><td>${opp['potential_profit']}</td></tr>" for opp in opportunities)}
-                    </table>
-                    
-                    <h2>Risk/Reward Matrix</h2>
-                    <table>
-                        <tr>
-                            <th>Category</th>
-                            <th>Risk Score</th>
-                            <th>Reward Score</th>
-                        </tr>
-                        {''.join(f"<tr><td>{k}</td><td>{v['risk']}</td><td>{v['reward']}</td></tr>" for k, v in risk_reward.items())}
-                    </table>
-                    
-                    <h2>Budget Allocation</h2>
-                    <table>
-                        <tr>
-                            <th>Category</th>
-                            <th>Amount</th>
-                            <th>Percentage</th>
-                        </tr>
-                        {''.join(f"<tr><td>{k}</td><td>${v['amount']}</td><td>{v['percentage']}%</td></tr>" for k, v in budget.items())}
-                    </table>
-                </body>
-            </html>
-            """
+            styles = getSampleStyleSheet()
             
-            # Convert to PDF
-            return HTML(string=html_content).write_pdf()
+            # Build tables directly; these reports are purely tabular
+            opportunity_table = Table(
+                [['Item', 'Current Price', 'Estimated Value', 'Potential Profit']] +
+                [[item, f"${price}", f"${value}", f"${profit}"]
+                 for item, price, value, profit in map(_OPP_GET, opportunities)],
+                repeatRows=1
+            )
+            risk_reward_table = Table(
+                [['Category', 'Risk Score', 'Reward Score']] +
+                [[k, *_RISK_REWARD_GET(v)] for k, v in risk_reward.items()],
+                repeatRows=1
+            )
+            budget_table = Table(
+                [['Category', 'Amount', 'Percentage']] +
+                [[k, f"${amount}", f"{percentage}%"]
+                 for k, (amount, percentage) in zip(budget, map(_BUDGET_GET, budget.values()))],
+                repeatRows=1
+            )
+            
+            for table in (opportunity_table, risk_reward_table, budget_table):
+                table.setStyle(PDF_TABLE_STYLE)
+            
+            # Render to PDF
+            output = BytesIO()
+            doc = SimpleDocTemplate(output, pagesize=letter, title="Daily Opportunity Report")
+            doc.build([
+                Paragraph("Daily Opportunity Report", styles['Title']),
+                Paragraph("Top Opportunities", styles['Heading2']),
+                opportunity_table,
+                Spacer(1, 12),
+                Paragraph("Risk/Reward Matrix", styles['Heading2']),
+                risk_reward_table,
+                Spacer(1, 12),
+                Paragraph("Budget Allocation", styles['Heading2']),
+                budget_table
+            ])
+            return output.getvalue()
             
         except Exception as e:
             logger.error(f"PDF creation failed: {e}")
@@ -274,6 +493,9 @@ class BaseReporter:
             Excel workbook bytes
         """
         try:
+            if len(opportunities) > EXCEL_STREAMING_THRESHOLD:
+                return self._create_opportunity_excel_streaming(opportunities, risk_reward, budget)
+            
             # Create workbook
             wb = openpyxl.Workbook()
             
@@ -283,24 +505,23 @@ class BaseReporter:
             headers = ['Item', 'Current Price', 'Estimated Value', 'Potential Profit']
             ws1.append(headers)
             for opp in opportunities:
-                ws1.append([opp['item'], opp['current_price'], opp['estimated_value'], opp['potential_profit']])
+                ws1.append(_OPP_GET(opp))
             
             # Risk/Reward sheet
             ws2 = wb.create_sheet("Risk/Reward")
             headers = ['Category', 'Risk Score', 'Reward Score']
             ws2.append(headers)
             for category, scores in risk_reward.items():
-                ws2.append([category, scores['risk'], scores['reward']])
+                ws2.append((category, *_RISK_REWARD_GET(scores)))
             
             # Budget sheet
             ws3 = wb.create_sheet("Budget")
             headers = ['Category', 'Amount', 'Percentage']
             ws3.append(headers)
             for category, values in budget.items():
-                ws3.append([category, values['amount'], values['percentage']])
+                ws3.append((category, *_BUDGET_GET(values)))
             
             # Save to bytes
-            from io import BytesIO
             output = BytesIO()
             wb.save(output)
             return output.getvalue()
@@ -309,6 +530,50 @@ class BaseReporter:
             logger.error(f"Excel creation failed: {e}")
             return None
     
+    def _create_opportunity_excel_streaming(self, opportunities: List[Dict], risk_reward: Dict, budget: Dict) -> bytes:
+        """Create Excel workbook for daily opportunities in constant memory.
+        
+        Rows are flushed as they are written, so memory use does not grow
+        with the number of opportunities.
+        
+        Args:
+            opportunities: List of opportunities
+            risk_reward: Risk/reward matrix
+            budget: Budget allocation
+            
+        Returns:
+            Excel workbook bytes
+        """
+        try:
+            output = BytesIO()
+            wb = xlsxwriter.Workbook(output, {'constant_memory': True, 'in_memory': True})
+            header_fmt = wb.add_format({'bold': True, 'bg_color': '#F2F2F2'})
+            
+            # Opportunities sheet
+            ws1 = wb.add_worksheet("Opportunities")
+            ws1.write_row(0, 0, ['Item', 'Current Price', 'Estimated Value', 'Potential Profit'], header_fmt)
+            for row, opp in enumerate(opportunities, 1):
+                ws1.write_row(row, 0, _OPP_GET(opp))
+            
+            # Risk/Reward sheet
+            ws2 = wb.add_worksheet("Risk/Reward")
+            ws2.write_row(0, 0, ['Category', 'Risk Score', 'Reward Score'], header_fmt)
+            for row, (category, scores) in enumerate(risk_reward.items(), 1):
+                ws2.write_row(row, 0, (category, *_RISK_REWARD_GET(scores)))
+            
+            # Budget sheet
+            ws3 = wb.add_worksheet("Budget")
+            ws3.write_row(0, 0, ['Category', 'Amount', 'Percentage'], header_fmt)
+            for row, (category, values) in enumerate(budget.items(), 1):
+                ws3.write_row(row, 0, (category, *_BUDGET_GET(values)))
+            
+            wb.close()
+            return output.getvalue()
+            
+        except Exception as e:
+            logger.error(f"Streaming Excel creation failed: {e}")
+            return None
+    
     def _create_opportunity_email(self, opportunities: List[Dict], risk_reward: Dict, budget: Dict) -> str:
         """Create email digest for daily opportunities.
         
@@ -321,64 +586,12 @@ class BaseReporter:
             HTML email content
         """
         try:
-            # Create email content
-            email_content = f"""
-            <!DOCTYPE html>
-            <html>
-                <head>
-                    <title>Daily Opportunity Report</title>
-                    <style>
-                        body {{ font-family: Arial, sans-serif; }}
-                        table {{ border-collapse: collapse; width: 100%; margin-bottom: 20px; }}
-                        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                        th {{ background-color: #f5f5f5; }}
-                        .summary {{ margin-bottom: 20px; }}
-                    </style>
-                </head>
-                <body>
-                    <h1>Daily Opportunity Report</h1>
-                    
-                    <div class="summary">
-                        <h2>Top Opportunities</h2>
-                        <table>
-                            <tr>
-                                <th>Item</th>
-                                <th>Current Price</th>
-                                <th>Estimated Value</th>
-                                <th>Potential Profit</th>
-                            </tr>
-                            {''.join(f"<tr><td>{opp['item']}</td><td>${opp['current_price']}</td><td>${opp['estimated_value']}</td><td>${opp['potential_profit']}</td></tr>" for opp in opportunities[:5])}
-                        </table>
-                    </div>
-                    
-                    <div class="summary">
-                        <h2>Risk/Reward Summary</h2>
-                        <table>
-                            <tr>
-                                <th>Category</th>
-                                <th>Risk Score</th>
-                                <th>Reward Score</th>
-                            </tr>
-                            {''.join(f"<tr><td>{k}</td><td>{v['risk']}</td><td>{v['reward']}</td></tr>" for k, v in risk_reward.items())}
-                        </table>
-                    </div>
-                    
-                    <div class="summary">
-                        <h2>Budget Allocation</h2>
-                        <table>
-                            <tr>
-                                <th>Category</th>
-                                <th>Amount</th>
-                                <th>Percentage</th>
-                            </tr>
-                            {''.join(f"<tr><td>{k}</td><td>${v['amount']}</td><td>{v['percentage']}%</td></tr>" for k, v in budget.items())}
-                        </table>
-                    </div>
-                    
-                    <p>View the full report in your dashboard for more details.</p>
-                </body>
-            </html>
-            """
+            # Render precompiled template
+            email_content = OPPORTUNITY_EMAIL_TEMPLATE.render(
+                opportunities=opportunities[:5],
+                risk_reward=risk_reward,
+                budget=budget
+            )
             
             return email_content
             
@@ -1,14 +1,70 @@
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, TextIO, Union
+import heapq
 import logging
 from datetime import datetime, timedelta
+from operator import itemgetter
 import pandas as pd
 import numpy as np
-from decimal import Decimal
 
 from .base_reporter import BaseReporter
 
 logger = logging.getLogger(__name__)
 
+# Below this many opportunities ranking is done without a DataFrame
+SMALL_BATCH_SIZE = 200
+
+# Number of opportunities kept in the report
+TOP_N = 10
+
+# Columns the opportunity score needs; every opportunity must carry them
+SCORE_COLUMNS = (
+    'current_price', 'estimated_value', 'search_volume',
+    'number_of_sellers', 'price_volatility'
+)
+
+# Columns used in score arithmetic; condition_score only feeds risk/reward
+# and may be absent
+NUMERIC_COLUMNS = SCORE_COLUMNS + ('condition_score',)
+
+# Risk/reward used when an opportunity has no condition score, matching
+# the fallback of the per-opportunity calculations
+DEFAULT_RISK_REWARD = 0.5
+
+def _opportunity_scores(cp: np.ndarray, ev: np.ndarray, sv: np.ndarray,
+                        ns: np.ndarray, pv: np.ndarray) -> np.ndarray:
+    """Compute opportunity scores from column arrays.
+    
+    Args:
+        cp: Current prices
+        ev: Estimated values
+        sv: Search volumes
+        ns: Number of sellers
+        pv: Price volatilities
+        
+    Returns:
+        Array of opportunity scores
+    """
+    # Column maxima in one pass
+    sv_max, ns_max, pv_max = np.max(np.vstack((sv, ns, pv)), axis=1)
+    
+    # Combine factors into a single preallocated buffer:
+    # 0.4 * profit potential + 0.3 * market demand
+    # + 0.2 * (1 - competition) + 0.1 * (1 - price volatility)
+    score = np.empty_like(cp)
+    tmp = np.empty_like(cp)
+    np.subtract(ev, cp, out=score)
+    np.divide(score, cp, out=score)
+    np.multiply(score, 0.4, out=score)
+    np.multiply(sv, 0.3 / sv_max, out=tmp)
+    np.add(score, tmp, out=score)
+    np.multiply(ns, -0.2 / ns_max, out=tmp)
+    np.add(score, tmp, out=score)
+    np.multiply(pv, -0.1 / pv_max, out=tmp)
+    np.add(score, tmp, out=score)
+    np.add(score, 0.3, out=score)
+    
+    return score
+
 class OpportunityReporter(BaseReporter):
     """Generator for daily opportunity reports."""
     
@@ -28,16 +84,47 @@ class OpportunityReporter(BaseReporter):
             'medium': 0.5,
             'high': 0.7
         }
+        
+        # Sorted bucket bounds for vectorized level assignment
+        self._risk_bounds = np.array(sorted(self.risk_thresholds.values()))
+        self._risk_labels = np.array(['low', 'medium', 'high', 'critical'])
+        self._reward_bounds = np.array(sorted(self.reward_thresholds.values()))
+        self._reward_labels = np.array(['low', 'medium', 'high', 'exceptional'])
+    
+    def bucket_risk(self, scores: np.ndarray) -> np.ndarray:
+        """Map risk scores to risk levels.
+        
+        Args:
+            scores: Risk scores
+            
+        Returns:
+            Array of risk level labels
+        """
+        return self._risk_labels[np.searchsorted(self._risk_bounds, scores)]
+    
+    def bucket_reward(self, scores: np.ndarray) -> np.ndarray:
+        """Map reward scores to reward levels.
+        
+        Args:
+            scores: Reward scores
+            
+        Returns:
+            Array of reward level labels
+        """
+        return self._reward_labels[np.searchsorted(self._reward_bounds, scores)]
     
-    def generate_daily_report(self, data: Dict, format: str = 'dashboard') -> Union[str, bytes]:
+    def generate_daily_report(self, data: Dict, format: str = 'dashboard',
+                              out: Optional[TextIO] = None) -> Union[str, bytes]:
         """Generate daily opportunity report.
         
         Args:
             data: Raw data for the report
             format: Output format
+            out: Optional text stream to write the dashboard to, such as
+                a response body
             
         Returns:
-            Report in requested format
+            Report in requested format, or None when written to ``out``
         """
         try:
             # Process data
@@ -52,7 +139,11 @@ class OpportunityReporter(BaseReporter):
                 'budget': budget
             }
             
-            return self.generate_report('daily_opportunity', report_data, format)
+            # Only the dashboard renders from a DataFrame
+            if format == 'dashboard':
+                report_data['opportunities_df'] = pd.DataFrame.from_records(opportunities)
+            
+            return self.generate_report('daily_opportunity', report_data, format, out)
             
         except Exception as e:
             logger.error(f"Daily opportunity report generation failed: {e}")
@@ -68,9 +159,21 @@ class OpportunityReporter(BaseReporter):
             Processed and ranked opportunities
         """
         try:
+            if not opportunities:
+                return []
+            
+            # Small inputs are cheaper to rank directly than via a DataFrame
+            if len(opportunities) <= SMALL_BATCH_SIZE:
+                return self._rank_small_batch(opportunities)
+            
             # Convert to DataFrame for easier processing
             df = pd.DataFrame(opportunities)
             
+            # Keep scoring on the float path even if callers pass Decimals
+            for column in NUMERIC_COLUMNS:
+                if column in df:
+                    df[column] = pd.to_numeric(df[column], errors='coerce')
+            
             # Calculate opportunity score
             df['opportunity_score'] = self._calculate_opportunity_score(df)
             
@@ -78,7 +181,14 @@ class OpportunityReporter(BaseReporter):
             df = df.sort_values('opportunity_score', ascending=False)
             
             # Take top 10
-            df = df.head(10)
+            df = df.head(TOP_N)
+            
+            # Attach derived fields once for all downstream consumers
+            df = df.assign(
+                potential_profit=df['estimated_value'] - df['current_price'],
+                risk=self._calculate_risk_score_vec(df),
+                reward=self._calculate_reward_score_vec(df)
+            )
             
             # Convert back to list of dictionaries
             return df.to_dict('records')
@@ -87,6 +197,49 @@ class OpportunityReporter(BaseReporter):
             logger.error(f"Opportunity processing failed: {e}")
             return []
     
+    def _rank_small_batch(self, opportunities: List[Dict]) -> List[Dict]:
+        """Score and rank a small list of opportunities without pandas.
+        
+        Args:
+            opportunities: Raw opportunity data
+            
+        Returns:
+            Top opportunities with scores and derived fields, best first
+        """
+        count = len(opportunities)
+        columns = {
+            key: np.fromiter((opp[key] for opp in opportunities), dtype=np.float64, count=count)
+            for key in SCORE_COLUMNS
+        }
+        columns['condition_score'] = np.fromiter(
+            (opp.get('condition_score', np.nan) for opp in opportunities),
+            dtype=np.float64, count=count
+        )
+        
+        scores = _opportunity_scores(
+            columns['current_price'],
+            columns['estimated_value'],
+            columns['search_volume'],
+            columns['number_of_sellers'],
+            columns['price_volatility']
+        )
+        
+        top = heapq.nlargest(TOP_N, range(count), key=scores.__getitem__)
+        
+        # Attach derived fields for the selected rows only
+        top_columns = {key: values[top] for key, values in columns.items()}
+        fields = {
+            'opportunity_score': scores[top].tolist(),
+            'potential_profit': (top_columns['estimated_value'] - top_columns['current_price']).tolist(),
+            'risk': self._calculate_risk_score_vec(top_columns).tolist(),
+            'reward': self._calculate_reward_score_vec(top_columns).tolist()
+        }
+        
+        return [
+            {**opportunities[i], **{name: values[rank] for name, values in fields.items()}}
+            for rank, i in enumerate(top)
+        ]
+    
     def _calculate_opportunity_score(self, df: pd.DataFrame) -> pd.Series:
         """Calculate opportunity score for each item.
         
@@ -97,27 +250,15 @@ class OpportunityReporter(BaseReporter):
             Series of opportunity scores
         """
         try:
-            # Calculate profit potential
-            profit_potential = (df['estimated_value'] - df['current_price']) / df['current_price']
-            
-            # Calculate market demand
-            market_demand = df['search_volume'] / df['search_volume'].max()
-            
-            # Calculate competition level
-            competition = 1 - (df['number_of_sellers'] / df['number_of_sellers'].max())
-            
-            # Calculate price stability
-            price_stability = 1 - (df['price_volatility'] / df['price_volatility'].max())
-            
-            # Combine factors
-            score = (
-                0.4 * profit_potential +
-                0.3 * market_demand +
-                0.2 * competition +
-                0.1 * price_stability
+            score = _opportunity_scores(
+                df['current_price'].to_numpy(dtype=np.float64),
+                df['estimated_value'].to_numpy(dtype=np.float64),
+                df['search_volume'].to_numpy(dtype=np.float64),
+                df['number_of_sellers'].to_numpy(dtype=np.float64),
+                df['price_volatility'].to_numpy(dtype=np.float64)
             )
             
-            return score
+            return pd.Series(score, index=df.index)
             
         except Exception as e:
             logger.error(f"Opportunity score calculation failed: {e}")
@@ -133,40 +274,79 @@ class OpportunityReporter(BaseReporter):
             Risk/reward matrix
         """
         try:
-            risk_reward = {}
-            
-            for opp in opportunities:
-                category = opp['category']
-                
-                # Calculate risk score
-                risk_score = self._calculate_risk_score(opp)
-                
-                # Calculate reward score
-                reward_score = self._calculate_reward_score(opp)
-                
-                # Add to matrix
-                if category not in risk_reward:
-                    risk_reward[category] = {
-                        'risk': risk_score,
-                        'reward': reward_score,
-                        'count': 1
-                    }
-                else:
-                    # Average with existing scores
-                    existing = risk_reward[category]
-                    count = existing['count'] + 1
-                    risk_reward[category] = {
-                        'risk': (existing['risk'] * existing['count'] + risk_score) / count,
-                        'reward': (existing['reward'] * existing['count'] + reward_score) / count,
-                        'count': count
-                    }
-            
-            return risk_reward
+            if not opportunities:
+                return {}
+            
+            df = pd.DataFrame(opportunities)
+            
+            # Scores are attached while ranking; compute them for raw input
+            if 'risk' not in df:
+                df['risk'] = self._calculate_risk_score_vec(df)
+            if 'reward' not in df:
+                df['reward'] = self._calculate_reward_score_vec(df)
+            
+            # Average per category
+            matrix = df.groupby('category', sort=False).agg(
+                risk=('risk', 'mean'),
+                reward=('reward', 'mean'),
+                count=('risk', 'size')
+            )
+            matrix['risk_level'] = self.bucket_risk(matrix['risk'].to_numpy())
+            matrix['reward_level'] = self.bucket_reward(matrix['reward'].to_numpy())
+            
+            return matrix.to_dict('index')
             
         except Exception as e:
             logger.error(f"Risk/reward calculation failed: {e}")
             return {}
     
+    def _calculate_risk_score_vec(self, df: Union[pd.DataFrame, Dict[str, np.ndarray]]) -> np.ndarray:
+        """Calculate risk scores for a batch of opportunities.
+        
+        Vectorized form of _calculate_risk_score.
+        
+        Args:
+            df: DataFrame or column arrays of opportunities
+            
+        Returns:
+            Array of risk scores between 0 and 1; rows without a
+            condition score get DEFAULT_RISK_REWARD
+        """
+        pv = np.asarray(df['price_volatility'], dtype=np.float64)
+        ns = np.asarray(df['number_of_sellers'], dtype=np.float64)
+        sv = np.asarray(df['search_volume'], dtype=np.float64)
+        cs = np.asarray(df.get('condition_score', np.nan), dtype=np.float64)
+        
+        # 0.3 * price + 0.3 * competition + 0.2 * demand + 0.2 * condition risk
+        risk = np.clip(0.3 * pv + 0.003 * ns - 0.0002 * sv - 0.2 * cs + 0.4, 0, 1)
+        risk[np.isnan(risk)] = DEFAULT_RISK_REWARD
+        
+        return risk
+    
+    def _calculate_reward_score_vec(self, df: Union[pd.DataFrame, Dict[str, np.ndarray]]) -> np.ndarray:
+        """Calculate reward scores for a batch of opportunities.
+        
+        Vectorized form of _calculate_reward_score.
+        
+        Args:
+            df: DataFrame or column arrays of opportunities
+            
+        Returns:
+            Array of reward scores between 0 and 1; rows without a
+            condition score get DEFAULT_RISK_REWARD
+        """
+        cp = np.asarray(df['current_price'], dtype=np.float64)
+        ev = np.asarray(df['estimated_value'], dtype=np.float64)
+        sv = np.asarray(df['search_volume'], dtype=np.float64)
+        pv = np.asarray(df['price_volatility'], dtype=np.float64)
+        cs = np.asarray(df.get('condition_score', np.nan), dtype=np.float64)
+        
+        # 0.4 * profit + 0.3 * demand + 0.2 * stability + 0.1 * condition
+        reward = np.clip(0.4 * (ev - cp) / cp + 0.0003 * sv - 0.2 * pv + 0.1 * cs + 0.2, 0, 1)
+        reward[np.isnan(reward)] = DEFAULT_RISK_REWARD
+        
+        return reward
+    
     def _calculate_risk_score(self, opportunity: Dict) -> float:
         """Calculate risk score for an opportunity.
         
@@ -249,32 +429,21 @@ class OpportunityReporter(BaseReporter):
             Budget allocation suggestions
         """
         try:
-            budget = {}
-            total_score = 0
-            
-            # Calculate total opportunity score
-            for opp in opportunities:
-                total_score += opp['opportunity_score']
-            
-            # Allocate budget based on opportunity scores
-            for opp in opportunities:
-                category = opp['category']
-                allocation = opp['opportunity_score'] / total_score
-                
-                if category not in budget:
-                    budget[category] = {
-                        'amount': allocation,
-                        'percentage': allocation * 100
-                    }
-                else:
-                    # Add to existing allocation
-                    existing = budget[category]
-                    budget[category] = {
-                        'amount': existing['amount'] + allocation,
-                        'percentage': (existing['amount'] + allocation) * 100
-                    }
-            
-            return budget
+            if not opportunities:
+                return {}
+            
+            # Sum opportunity scores per category in one pass
+            df = pd.DataFrame(opportunities)
+            scores = df.groupby('category', sort=False)['opportunity_score'].sum()
+            share = scores / scores.sum()
+            
+            return {
+                category: {
+                    'amount': float(amount),
+                    'percentage': float(amount * 100)
+                }
+                for category, amount in share.items()
+            }
             
         except Exception as e:
             logger.error(f"Budget allocation calculation failed: {e}")
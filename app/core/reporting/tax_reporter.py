@@ -1,14 +1,166 @@
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 import logging
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 from decimal import Decimal
+from numba import njit
 
 from .base_reporter import BaseReporter
 
 logger = logging.getLogger(__name__)
 
+# Inventory age buckets and their lower edges in days (after the first)
+AGE_BUCKETS = ('0-30_days', '31-90_days', '91-180_days', '180+_days')
+AGE_BUCKET_EDGES = np.array([31, 91, 181])
+
+# Group for records whose grouping field is missing
+MISSING_GROUP = 'Uncategorized'
+
+def _to_cents(values) -> np.ndarray:
+    """Convert monetary amounts to integer cents.
+    
+    Args:
+        values: Amounts as floats, strings or Decimals
+        
+    Returns:
+        Array of int64 cents
+    """
+    return np.rint(np.asarray(values, dtype=np.float64) * 100).astype(np.int64)
+
+def _from_cents(cents: float) -> Decimal:
+    """Convert an aggregated cent amount to a Decimal in currency units.
+    
+    Args:
+        cents: Amount in cents
+        
+    Returns:
+        Decimal amount with two decimal places
+    """
+    return Decimal(int(round(float(cents)))).scaleb(-2)
+
+def _to_percent(part: Decimal, total: Decimal) -> Decimal:
+    """Express part as a percentage of total.
+    
+    Args:
+        part: Amount
+        total: Nonzero total amount
+        
+    Returns:
+        Unrounded Decimal percentage
+    """
+    return (part / total) * 100
+
+def _month_codes(dates: List) -> Tuple[np.ndarray, List[str]]:
+    """Bucket dates by calendar month.
+    
+    Args:
+        dates: Dates or datetimes
+        
+    Returns:
+        Month code per date and the 'YYYY-MM' key for each code
+    """
+    months = np.array(dates, dtype='datetime64[us]').astype('datetime64[M]')
+    keys, codes = np.unique(months, return_inverse=True)
+    return codes, keys.astype(str).tolist()
+
+def _factorize(values: List) -> Tuple[np.ndarray, List]:
+    """Encode group labels as integer codes.
+    
+    Missing labels are grouped under MISSING_GROUP, so every code is a
+    valid index into the group totals.
+    
+    Args:
+        values: Group label per record
+        
+    Returns:
+        Non-negative int64 code per record and the label for each code
+    """
+    codes, labels = pd.factorize(pd.Series(values, dtype=object).fillna(MISSING_GROUP))
+    return codes.astype(np.int64), labels.tolist()
+
+@njit(cache=True)
+def _reduce_fees(amounts: np.ndarray, category_codes: np.ndarray,
+                 month_codes: np.ndarray, deductible: np.ndarray,
+                 n_categories: int, n_months: int) -> Tuple[np.ndarray, np.ndarray, int, int]:
+    """Total fees by category, month and deductibility in one pass.
+    
+    Args:
+        amounts: Fee amount in cents
+        category_codes: Category code per fee, from _factorize
+        month_codes: Month code per fee
+        deductible: Whether each fee is deductible
+        n_categories: Number of categories
+        n_months: Number of months
+        
+    Returns:
+        Category totals, month totals, deductible total and non-deductible total in cents
+    """
+    category_totals = np.zeros(n_categories, dtype=np.int64)
+    month_totals = np.zeros(n_months, dtype=np.int64)
+    deductible_total = 0
+    non_deductible_total = 0
+    for i in range(amounts.shape[0]):
+        amount = amounts[i]
+        category_totals[category_codes[i]] += amount
+        month_totals[month_codes[i]] += amount
+        if deductible[i]:
+            deductible_total += amount
+        else:
+            non_deductible_total += amount
+    return category_totals, month_totals, deductible_total, non_deductible_total
+
+def _reduce_inventory(cost: np.ndarray, market: np.ndarray,
+                      category_codes: np.ndarray, n_categories: int,
+                      condition_codes: np.ndarray, n_conditions: int,
+                      age_buckets: np.ndarray) -> Dict[str, np.ndarray]:
+    """Compute every inventory aggregate back to back over the same arrays.
+    
+    Args:
+        cost: Item cost in cents
+        market: Item market value in cents
+        category_codes: Category code per item, from _factorize
+        n_categories: Number of categories
+        condition_codes: Condition code per item, from _factorize
+        n_conditions: Number of conditions
+        age_buckets: Age bucket index per item
+        
+    Returns:
+        Dictionary of per-group counts and totals in cents
+    """
+    return {
+        'category_counts': np.bincount(category_codes, minlength=n_categories),
+        'category_values': np.bincount(category_codes, weights=cost, minlength=n_categories),
+        'condition_counts': np.bincount(condition_codes, minlength=n_conditions),
+        'condition_values': np.bincount(condition_codes, weights=cost, minlength=n_conditions),
+        'age_counts': np.bincount(age_buckets, minlength=len(AGE_BUCKETS)),
+        'cost': cost.sum(),
+        'market': market.sum(),
+        'lower_of_cost_or_market': np.minimum(cost, market).sum()
+    }
+
+def _value_breakdown(keys, counts: np.ndarray, values: np.ndarray, total: float) -> Dict:
+    """Build per-group count/value entries with each group's share of the total.
+    
+    Args:
+        keys: Group names
+        counts: Item count per group
+        values: Value per group in cents
+        total: Total value in cents
+        
+    Returns:
+        Dictionary of group name to count, value and percentage
+    """
+    groups = {
+        k: {'count': int(n), 'value': _from_cents(v)}
+        for k, n, v in zip(keys, counts, values)
+    }
+    if total > 0:
+        total_value = _from_cents(total)
+        for group in groups.values():
+            group['percentage'] = _to_percent(group['value'], total_value)
+    return groups
+
 class TaxReporter(BaseReporter):
     """Generator for tax preparation reports."""
     
@@ -23,6 +175,10 @@ class TaxReporter(BaseReporter):
             'exempt': Decimal('0.0')        # 0%
         }
         
+        # Integer code per rate and the rates as floats, indexable by code
+        self._rate_codes = {name: code for code, name in enumerate(self.sales_tax_rates)}
+        self._rate_values = np.array([float(rate) for rate in self.sales_tax_rates.values()], dtype=np.float64)
+        
         # Fee categories
         self.fee_categories = {
             'platform_fees': ['listing_fee', 'final_value_fee', 'store_fee'],
@@ -78,39 +234,34 @@ class TaxReporter(BaseReporter):
                 'non_deductible': Decimal('0')
             }
             
-            for fee in fees:
-                amount = Decimal(str(fee['amount']))
-                category = fee['category']
-                month = fee['date'].strftime('%Y-%m')
-                is_deductible = fee.get('deductible', True)
-                
-                # Add to total
-                fee_summary['total_fees'] += amount
-                
-                # Add to category
-                if category not in fee_summary['by_category']:
-                    fee_summary['by_category'][category] = Decimal('0')
-                fee_summary['by_category'][category] += amount
-                
-                # Add to month
-                if month not in fee_summary['by_month']:
-                    fee_summary['by_month'][month] = Decimal('0')
-                fee_summary['by_month'][month] += amount
-                
-                # Add to deductible/non-deductible
-                if is_deductible:
-                    fee_summary['deductible'] += amount
-                else:
-                    fee_summary['non_deductible'] += amount
+            if not fees:
+                return fee_summary
+            
+            # Columnar view of the fees with amounts in integer cents
+            amounts = _to_cents([fee['amount'] for fee in fees])
+            category_codes, categories = _factorize([fee['category'] for fee in fees])
+            month_codes, months = _month_codes([fee['date'] for fee in fees])
+            deductible = np.fromiter(
+                (fee.get('deductible', True) for fee in fees), dtype=bool, count=len(fees)
+            )
+            
+            by_category, by_month, deductible_total, non_deductible_total = _reduce_fees(
+                amounts, category_codes, month_codes.astype(np.int64),
+                deductible, len(categories), len(months)
+            )
+            total = deductible_total + non_deductible_total
+            
+            # Convert to Decimal once at the report boundary
+            fee_summary['total_fees'] = _from_cents(total)
+            fee_summary['by_category'] = {k: _from_cents(v) for k, v in zip(categories, by_category)}
+            fee_summary['by_month'] = {k: _from_cents(v) for k, v in zip(months, by_month)}
+            fee_summary['deductible'] = _from_cents(deductible_total)
+            fee_summary['non_deductible'] = _from_cents(non_deductible_total)
             
             # Calculate percentages
-            if fee_summary['total_fees'] > 0:
-                fee_summary['deductible_percentage'] = (
-                    fee_summary['deductible'] / fee_summary['total_fees']
-                ) * 100
-                fee_summary['non_deductible_percentage'] = (
-                    fee_summary['non_deductible'] / fee_summary['total_fees']
-                ) * 100
+            if total > 0:
+                fee_summary['deductible_percentage'] = _to_percent(fee_summary['deductible'], fee_summary['total_fees'])
+                fee_summary['non_deductible_percentage'] = _to_percent(fee_summary['non_deductible'], fee_summary['total_fees'])
             
             return fee_summary
             
@@ -146,63 +297,38 @@ class TaxReporter(BaseReporter):
                 }
             }
             
-            for item in inventory:
-                cost = Decimal(str(item['cost']))
-                market_value = Decimal(str(item['market_value']))
-                category = item['category']
-                condition = item['condition']
-                age_days = (datetime.now() - item['purchase_date']).days
-                
-                # Add to total value
-                inventory_summary['total_value'] += cost
-                
-                # Add to category
-                if category not in inventory_summary['by_category']:
-                    inventory_summary['by_category'][category] = {
-                        'count': 0,
-                        'value': Decimal('0')
-                    }
-                cat_stats = inventory_summary['by_category'][category]
-                cat_stats['count'] += 1
-                cat_stats['value'] += cost
-                
-                # Add to condition
-                if condition not in inventory_summary['by_condition']:
-                    inventory_summary['by_condition'][condition] = {
-                        'count': 0,
-                        'value': Decimal('0')
-                    }
-                cond_stats = inventory_summary['by_condition'][condition]
-                cond_stats['count'] += 1
-                cond_stats['value'] += cost
-                
-                # Add to age distribution
-                if age_days <= 30:
-                    inventory_summary['age_distribution']['0-30_days'] += 1
-                elif age_days <= 90:
-                    inventory_summary['age_distribution']['31-90_days'] += 1
-                elif age_days <= 180:
-                    inventory_summary['age_distribution']['91-180_days'] += 1
-                else:
-                    inventory_summary['age_distribution']['180+_days'] += 1
-                
-                # Add to valuation methods
-                inventory_summary['valuation_methods']['cost'] += cost
-                inventory_summary['valuation_methods']['market'] += market_value
-                inventory_summary['valuation_methods']['lower_of_cost_or_market'] += min(cost, market_value)
+            if not inventory:
+                return inventory_summary
             
-            # Calculate percentages
-            for category in inventory_summary['by_category'].values():
-                if inventory_summary['total_value'] > 0:
-                    category['percentage'] = (
-                        category['value'] / inventory_summary['total_value']
-                    ) * 100
+            # Columnar view of the inventory with values in integer cents
+            cost = _to_cents([item['cost'] for item in inventory])
+            market = _to_cents([item['market_value'] for item in inventory])
+            category_codes, categories = _factorize([item['category'] for item in inventory])
+            condition_codes, conditions = _factorize([item['condition'] for item in inventory])
+            purchased = np.array([item['purchase_date'] for item in inventory], dtype='datetime64[us]')
+            ages = (np.datetime64(datetime.now(), 'us') - purchased) // np.timedelta64(1, 'D')
             
-            for condition in inventory_summary['by_condition'].values():
-                if inventory_summary['total_value'] > 0:
-                    condition['percentage'] = (
-                        condition['value'] / inventory_summary['total_value']
-                    ) * 100
+            # All reductions in one pass over the hot arrays
+            totals = _reduce_inventory(
+                cost, market, category_codes, len(categories),
+                condition_codes, len(conditions), np.digitize(ages, AGE_BUCKET_EDGES)
+            )
+            
+            inventory_summary['total_value'] = _from_cents(totals['cost'])
+            inventory_summary['by_category'] = _value_breakdown(
+                categories, totals['category_counts'], totals['category_values'], totals['cost']
+            )
+            inventory_summary['by_condition'] = _value_breakdown(
+                conditions, totals['condition_counts'], totals['condition_values'], totals['cost']
+            )
+            inventory_summary['age_distribution'] = {
+                bucket: int(n) for bucket, n in zip(AGE_BUCKETS, totals['age_counts'])
+            }
+            inventory_summary['valuation_methods'] = {
+                'cost': _from_cents(totals['cost']),
+                'market': _from_cents(totals['market']),
+                'lower_of_cost_or_market': _from_cents(totals['lower_of_cost_or_market'])
+            }
             
             return inventory_summary
             
@@ -233,66 +359,49 @@ class TaxReporter(BaseReporter):
                 'monthly_totals': {}
             }
             
-            for sale in sales:
-                amount = Decimal(str(sale['amount']))
-                tax_rate = sale.get('tax_rate', 'standard')
-                state = sale['state']
-                category = sale['category']
-                month = sale['date'].strftime('%Y-%m')
-                
-                # Calculate tax
-                tax_amount = amount * self.sales_tax_rates[tax_rate]
-                
-                # Add to totals
-                sales_tax_summary['total_sales'] += amount
-                sales_tax_summary['total_tax'] += tax_amount
-                
-                # Add to state
-                if state not in sales_tax_summary['by_state']:
-                    sales_tax_summary['by_state'][state] = {
-                        'sales': Decimal('0'),
-                        'tax': Decimal('0')
-                    }
-                state_stats = sales_tax_summary['by_state'][state]
-                state_stats['sales'] += amount
-                state_stats['tax'] += tax_amount
-                
-                # Add to category
-                if category not in sales_tax_summary['by_category']:
-                    sales_tax_summary['by_category'][category] = {
-                        'sales': Decimal('0'),
-                        'tax': Decimal('0')
-                    }
-                cat_stats = sales_tax_summary['by_category'][category]
-                cat_stats['sales'] += amount
-                cat_stats['tax'] += tax_amount
-                
-                # Add to rate
-                sales_tax_summary['by_rate'][tax_rate] += tax_amount
-                
-                # Add to monthly totals
-                if month not in sales_tax_summary['monthly_totals']:
-                    sales_tax_summary['monthly_totals'][month] = {
-                        'sales': Decimal('0'),
-                        'tax': Decimal('0')
-                    }
-                month_stats = sales_tax_summary['monthly_totals'][month]
-                month_stats['sales'] += amount
-                month_stats['tax'] += tax_amount
+            if not sales:
+                return sales_tax_summary
             
-            # Calculate percentages
-            if sales_tax_summary['total_sales'] > 0:
-                sales_tax_summary['effective_tax_rate'] = (
-                    sales_tax_summary['total_tax'] / sales_tax_summary['total_sales']
-                ) * 100
+            # Columnar view of the sales; amounts in cents, tax in fractional cents
+            amounts = _to_cents([sale['amount'] for sale in sales])
+            rate_codes = np.fromiter(
+                (self._rate_codes[sale.get('tax_rate', 'standard')] for sale in sales),
+                dtype=np.int8, count=len(sales)
+            )
+            taxes = amounts * self._rate_values[rate_codes]
+            
+            state_codes, states = _factorize([sale['state'] for sale in sales])
+            category_codes, categories = _factorize([sale['category'] for sale in sales])
+            month_codes, months = _month_codes([sale['date'] for sale in sales])
             
-            for state in sales_tax_summary['by_state'].values():
-                if state['sales'] > 0:
-                    state['rate'] = (state['tax'] / state['sales']) * 100
+            def totals_by(codes: np.ndarray, keys, with_rate: bool = True) -> Dict:
+                sales_totals = np.bincount(codes, weights=amounts, minlength=len(keys))
+                tax_totals = np.bincount(codes, weights=taxes, minlength=len(keys))
+                groups = {
+                    k: {'sales': _from_cents(a), 'tax': _from_cents(t)}
+                    for k, a, t in zip(keys, sales_totals, tax_totals)
+                }
+                if with_rate:
+                    for group in groups.values():
+                        if group['sales'] > 0:
+                            group['rate'] = _to_percent(group['tax'], group['sales'])
+                return groups
+            
+            sales_tax_summary['total_sales'] = _from_cents(amounts.sum())
+            sales_tax_summary['total_tax'] = _from_cents(taxes.sum())
+            sales_tax_summary['by_state'] = totals_by(state_codes, states)
+            sales_tax_summary['by_category'] = totals_by(category_codes, categories)
+            sales_tax_summary['monthly_totals'] = totals_by(month_codes, months, with_rate=False)
+            rate_totals = np.bincount(rate_codes, weights=taxes, minlength=len(self._rate_codes))
+            sales_tax_summary['by_rate'] = {
+                k: _from_cents(t) for k, t in zip(self._rate_codes, rate_totals)
+            }
             
-            for category in sales_tax_summary['by_category'].values():
-                if category['sales'] > 0:
-                    category['rate'] = (category['tax'] / category['sales']) * 100
+            # Calculate percentages
+            if sales_tax_summary['total_sales'] > 0:
+                sales_tax_summary['effective_tax_rate'] = _to_percent(
+                    sales_tax_summary['total_tax'], sales_tax_summary['total_sales']
+                )
             
             return sales_tax_summary
             
@@ -1,28 +1,45 @@
 from typing import Dict, List, Optional
 import logging
 import os
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import json
+import orjson
 from dotenv import load_dotenv
+import numpy as np
+from cachetools import TTLCache
 
-from .base_research import BaseResearch
+from .base_research import BaseResearch, BATCH_WORKERS, REQUEST_TIMEOUT
 
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# API credentials, read once at import
+AMAZON_API_KEY = os.getenv("AMAZON_API_KEY")
+KEEPA_API_KEY = os.getenv("KEEPA_API_KEY")
+
+# Keepa product responses are reused for this long
+KEEPA_CACHE_TTL = 300  # seconds
+
+# Average daily rank change above which sales velocity is High/Medium
+HIGH_VELOCITY_CHANGE = 100
+MEDIUM_VELOCITY_CHANGE = 50
+
 class AmazonResearch(BaseResearch):
     """Amazon-specific research service."""
     
+    base_url = "https://api.amazon.com"
+    keepa_url = "https://api.keepa.com"
+    
     def __init__(self):
         """Initialize the Amazon research service."""
         super().__init__()
-        self.api_key = os.getenv("AMAZON_API_KEY")
-        self.keepa_key = os.getenv("KEEPA_API_KEY")
-        self.base_url = "https://api.amazon.com"
-        self.keepa_url = "https://api.keepa.com"
+        self.api_key = AMAZON_API_KEY
+        self.keepa_key = KEEPA_API_KEY
+        self._keepa_cache = TTLCache(maxsize=1024, ttl=KEEPA_CACHE_TTL)
+        self._keepa_lock = threading.Lock()
     
     def get_amazon_data(self, asin: str) -> Dict:
         """Get Amazon product data.
@@ -65,6 +82,68 @@ class AmazonResearch(BaseResearch):
             logger.error(f"Failed to get Amazon data for ASIN {asin}: {e}")
             return {}
     
+    def get_amazon_batch(self, asins: List[str]) -> Dict[str, np.ndarray]:
+        """Get Amazon product data for many ASINs.
+        
+        Lookups run concurrently over the shared session and results are
+        returned as one array per field, aligned with ``asins``. ASINs
+        that could not be researched have NaN prices and empty labels.
+        
+        Args:
+            asins: Amazon ASINs
+            
+        Returns:
+            Dictionary of column arrays
+        """
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as executor:
+            results = list(executor.map(self._get_batch_inputs, asins))
+        
+        def column(key: str) -> np.ndarray:
+            return np.array([r[key] if r else np.nan for r in results], dtype=np.float64)
+        
+        found = np.array([bool(r) for r in results], dtype=bool)
+        velocity = self._classify_sales_velocity(column("avg_rank_change"))
+        return_risk = self._classify_return_risk(column("rating"), column("review_count"))
+        
+        return {
+            "asin": np.array(asins, dtype=str),
+            "current_price": column("current_price"),
+            "30d_avg": column("30d_avg"),
+            "30d_low": column("30d_low"),
+            "sales_velocity": np.where(found, velocity, ""),
+            "return_risk": np.where(found, return_risk, "")
+        }
+    
+    def _get_batch_inputs(self, asin: str) -> Dict:
+        """Fetch the raw per-ASIN values used by get_amazon_batch.
+        
+        Args:
+            asin: Amazon ASIN
+            
+        Returns:
+            Dictionary of raw values, or empty dict if unavailable
+        """
+        try:
+            product_data = self._get_product_data(asin)
+            if not product_data:
+                return {}
+            
+            price_history = self._get_price_history(asin)
+            avg_change = self._average_rank_change(self._get_sales_rank(asin))
+            
+            return {
+                "current_price": product_data.get("price", 0.0),
+                "30d_avg": price_history.get("30d_avg", 0.0),
+                "30d_low": price_history.get("30d_low", 0.0),
+                "avg_rank_change": np.nan if avg_change is None else avg_change,
+                "rating": product_data.get("rating", 0.0),
+                "review_count": product_data.get("review_count", 0)
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to get Amazon data for ASIN {asin}: {e}")
+            return {}
+    
     def _get_product_data(self, asin: str) -> Dict:
         """Get current product data from Amazon API.
         
@@ -80,13 +159,14 @@ class AmazonResearch(BaseResearch):
                 "Content-Type": "application/json"
             }
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/products/{asin}",
-                headers=headers
+                headers=headers,
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Validate price
             if not self.validate_price(data["price"], [data["price"]]):
@@ -104,6 +184,42 @@ class AmazonResearch(BaseResearch):
             logger.error(f"Failed to get product data for ASIN {asin}: {e}")
             return {}
     
+    def _get_keepa_product(self, asin: str) -> Dict:
+        """Get the Keepa product payload for an ASIN.
+        
+        Price history and sales rank both come from this one response,
+        so it is fetched once and cached briefly.
+        
+        Args:
+            asin: Amazon ASIN
+            
+        Returns:
+            Parsed Keepa product data
+        """
+        with self._keepa_lock:
+            data = self._keepa_cache.get(asin)
+        if data is not None:
+            return data
+        
+        params = {
+            "key": self.keepa_key,
+            "domain": 1,  # Amazon.com
+            "asin": asin,
+            "stats": 1
+        }
+        
+        response = self.session.get(
+            f"{self.keepa_url}/product",
+            params=params,
+            timeout=REQUEST_TIMEOUT
+        )
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        with self._keepa_lock:
+            self._keepa_cache[asin] = data
+        return data
+    
     def _get_price_history(self, asin: str) -> Dict:
         """Get price history from Keepa API.
         
@@ -114,20 +230,7 @@ class AmazonResearch(BaseResearch):
             Dictionary containing price history
         """
         try:
-            params = {
-                "key": self.keepa_key,
-                "domain": 1,  # Amazon.com
-                "asin": asin,
-                "stats": 1
-            }
-            
-            response = requests.get(
-                f"{self.keepa_url}/product",
-                params=params
-            )
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_keepa_product(asin)
             
             # Extract 30-day price statistics
             prices = data.get("prices", [])
@@ -137,11 +240,16 @@ class AmazonResearch(BaseResearch):
                 return {"30d_avg": 0.0, "30d_low": 0.0}
             
             # Trim outliers
-            valid_prices = self.trim_outliers([p["price"] for p in recent_prices])
+            valid_prices = self.trim_outliers(
+                np.fromiter((p["price"] for p in recent_prices), dtype=np.float64, count=len(recent_prices))
+            )
+            
+            if not valid_prices.size:
+                return {"30d_avg": 0.0, "30d_low": 0.0}
             
             return {
-                "30d_avg": sum(valid_prices) / len(valid_prices) if valid_prices else 0.0,
-                "30d_low": min(valid_prices) if valid_prices else 0.0
+                "30d_avg": float(valid_prices.mean()),
+                "30d_low": float(valid_prices.min())
             }
             
         except Exception as e:
@@ -158,20 +266,7 @@ class AmazonResearch(BaseResearch):
             List of sales rank data points
         """
         try:
-            params = {
-                "key": self.keepa_key,
-                "domain": 1,
-                "asin": asin,
-                "stats": 1
-            }
-            
-            response = requests.get(
-                f"{self.keepa_url}/product",
-                params=params
-            )
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_keepa_product(asin)
             return data.get("sales_rank", [])
             
         except Exception as e:
@@ -187,24 +282,63 @@ class AmazonResearch(BaseResearch):
         Returns:
             Sales velocity category (High/Medium/Low)
         """
-        if not sales_rank:
+        avg_change = self._average_rank_change(sales_rank)
+        if avg_change is None:
             return "Unknown"
         
-        # Calculate average daily rank change
-        rank_changes = []
-        for i in range(1, len(sales_rank)):
-            change = sales_rank[i]["rank"] - sales_rank[i-1]["rank"]
-            rank_changes.append(change)
-        
-        avg_change = sum(rank_changes) / len(rank_changes) if rank_changes else 0
-        
-        if avg_change > 100:
+        if avg_change > HIGH_VELOCITY_CHANGE:
             return "High"
-        elif avg_change > 50:
+        elif avg_change > MEDIUM_VELOCITY_CHANGE:
             return "Medium"
         else:
             return "Low"
     
+    def _average_rank_change(self, sales_rank: List[Dict]) -> Optional[float]:
+        """Calculate the average change between consecutive sales ranks.
+        
+        Args:
+            sales_rank: List of sales rank data points
+            
+        Returns:
+            Average rank change, or None without rank history
+        """
+        if not sales_rank:
+            return None
+        
+        ranks = np.fromiter((point["rank"] for point in sales_rank), dtype=np.float64)
+        return float(np.diff(ranks).mean()) if ranks.size > 1 else 0.0
+    
+    def _classify_sales_velocity(self, avg_changes: np.ndarray) -> np.ndarray:
+        """Vectorized form of _calculate_sales_velocity.
+        
+        Args:
+            avg_changes: Average rank changes, NaN where unknown
+            
+        Returns:
+            Array of sales velocity categories
+        """
+        return np.select(
+            [np.isnan(avg_changes), avg_changes > HIGH_VELOCITY_CHANGE, avg_changes > MEDIUM_VELOCITY_CHANGE],
+            ["Unknown", "High", "Medium"],
+            default="Low"
+        )
+    
+    def _classify_return_risk(self, ratings: np.ndarray, review_counts: np.ndarray) -> np.ndarray:
+        """Vectorized form of _calculate_return_risk.
+        
+        Args:
+            ratings: Product ratings
+            review_counts: Product review counts
+            
+        Returns:
+            Array of return risk categories
+        """
+        return np.select(
+            [(ratings < 3.5) & (review_counts > 100), (ratings < 4.0) & (review_counts > 50)],
+            ["High (25%)", "Medium (12%)"],
+            default="Low (5%)"
+        )
+    
     def _calculate_return_risk(self, product_data: Dict) -> str:
         """Calculate return risk based on product data.
         
@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Union
 import logging
+import threading
 from datetime import datetime, timedelta
 import numpy as np
+import requests
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
@@ -11,12 +17,60 @@ from src.services.models import Item
 
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeout for research API requests, in seconds
+REQUEST_TIMEOUT = (3, 10)
+
+# Similar-item queries; an exact UPC match can use the upc index, and the
+# trigram % operator (threshold set per transaction) can use the GIN index
+_QUERY_BY_UPC = text("""
+    SELECT * FROM items
+    WHERE upc = :upc
+    AND created_at > NOW() - INTERVAL '30 days'
+""")
+_QUERY_BY_SIMILARITY = text("""
+    SELECT * FROM items
+    WHERE brand % :brand
+    AND model % :model
+    AND category LIKE :category
+    AND created_at > NOW() - INTERVAL '30 days'
+""")
+# SET LOCAL reverts at transaction end, so the pooled connection keeps
+# its default threshold for other queries
+_SET_SIMILARITY_THRESHOLD = text("SET LOCAL pg_trgm.similarity_threshold = 0.85")
+
+# Similar-item lookups shared across research instances
+_similar_items_cache = TTLCache(maxsize=4096, ttl=300)
+_similar_items_lock = threading.Lock()
+
+# Concurrent lookups for batch research; matches the session pool size
+BATCH_WORKERS = 16
+
 class BaseResearch(ABC):
     """Base class for product research services."""
     
     def __init__(self):
         """Initialize the research service."""
         self.db = next(get_db())
+        self.session = self._create_session()
+    
+    def _create_session(self) -> requests.Session:
+        """Create an HTTP session with connection pooling and retries.
+        
+        Returns:
+            Configured requests session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        session.mount("https://", adapter)
+        return session
     
     def check_database(self, upc: Optional[str] = None, brand: Optional[str] = None,
                       model: Optional[str] = None, category: Optional[str] = None) -> List[Dict]:
@@ -32,30 +86,50 @@ class BaseResearch(ABC):
             List of similar items from database
         """
         try:
-            query = """
-                SELECT * FROM items 
-                WHERE (upc = :upc 
-                    OR (similarity(brand, :brand) > 0.85 
-                        AND similarity(model, :model) > 0.85
-                        AND category LIKE :category))
-                AND created_at > :recency
-            """
-            
-            params = {
-                "upc": upc,
-                "brand": brand,
-                "model": model,
-                "category": f"%{category}%" if category else "%",
-                "recency": datetime.utcnow() - timedelta(days=30)
-            }
-            
-            result = self.db.execute(text(query), params)
-            return [dict(row) for row in result]
+            # Rows are flat, so copying each keeps the cached ones untouched
+            return [dict(item) for item in self._query_similar_items(upc, brand, model, category)]
             
         except Exception as e:
             logger.error(f"Database check failed: {e}")
             return []
     
+    @cached(
+        cache=_similar_items_cache,
+        key=lambda self, upc=None, brand=None, model=None, category=None: hashkey(upc, brand, model, category),
+        lock=_similar_items_lock
+    )
+    def _query_similar_items(self, upc: Optional[str], brand: Optional[str],
+                             model: Optional[str], category: Optional[str]) -> List[Dict]:
+        """Query the database for similar items.
+        
+        Results are cached per (upc, brand, model, category) and shared
+        between callers, so they must not be mutated; check_database
+        returns copies. Failures raise and are not cached.
+        
+        Args:
+            upc: Optional UPC to search for
+            brand: Optional brand name
+            model: Optional model name
+            category: Optional category
+            
+        Returns:
+            List of similar items from database
+        """
+        if upc is not None:
+            result = self.db.execute(_QUERY_BY_UPC, {"upc": upc})
+            items = [dict(row) for row in result.mappings()]
+            if items or brand is None or model is None:
+                return items
+        
+        # No UPC match; fall back to brand/model similarity
+        self.db.execute(_SET_SIMILARITY_THRESHOLD)
+        result = self.db.execute(_QUERY_BY_SIMILARITY, {
+            "brand": brand,
+            "model": model,
+            "category": f"%{category}%" if category else "%"
+        })
+        return [dict(row) for row in result.mappings()]
+    
     @abstractmethod
     def get_amazon_data(self, asin: str) -> Dict:
         """Get Amazon product data.
@@ -98,38 +172,39 @@ class BaseResearch(ABC):
         
         return abs(price - median) <= 3 * std_dev
     
-    def trim_outliers(self, data: List[float], percentile: float = 5.0) -> List[float]:
+    def trim_outliers(self, data: Union[List[float], np.ndarray], percentile: float = 5.0) -> np.ndarray:
         """Trim outliers from data using percentile.
         
         Args:
-            data: List of values
+            data: List or array of values
             percentile: Percentile to trim from top and bottom
             
         Returns:
-            Trimmed list of values
+            Array of values within the percentile bounds
         """
-        if not data:
-            return []
-            
-        lower = np.percentile(data, percentile)
-        upper = np.percentile(data, 100 - percentile)
+        values = np.asarray(data, dtype=np.float64)
+        if not values.size:
+            return values
+        
+        lower, upper = np.percentile(values, [percentile, 100 - percentile])
         
-        return [x for x in data if lower <= x <= upper]
+        return values[(values >= lower) & (values <= upper)]
     
-    def calculate_weighted_average(self, values: List[float], weights: List[float]) -> float:
+    def calculate_weighted_average(self, values: Union[List[float], np.ndarray],
+                                   weights: Union[List[float], np.ndarray]) -> float:
         """Calculate weighted average of values.
         
         Args:
-            values: List of values
-            weights: List of weights
+            values: List or array of values
+            weights: List or array of weights
             
         Returns:
             Weighted average
         """
-        if not values or not weights or len(values) != len(weights):
+        if not len(values) or not len(weights) or len(values) != len(weights):
             return 0.0
             
-        return np.average(values, weights=weights)
+        return float(np.average(values, weights=weights))
     
     def format_output(self, amazon_data: Dict, ebay_data: Dict) -> Dict:
         """Format research data into output structure.
@@ -1,28 +1,34 @@
 from typing import Dict, List, Optional
 import logging
 import os
-import requests
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from datetime import datetime, timedelta
-import json
+import orjson
 from dotenv import load_dotenv
 
-from .base_research import BaseResearch
+from .base_research import BaseResearch, BATCH_WORKERS, REQUEST_TIMEOUT
 
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# API credentials, read once at import
+EBAY_API_KEY = os.getenv("EBAY_API_KEY")
+TERAPEAK_API_KEY = os.getenv("TERAPEAK_API_KEY")
+
 class EbayResearch(BaseResearch):
     """eBay Terapeak research service."""
     
+    base_url = "https://api.ebay.com"
+    terapeak_url = "https://api.terapeak.com"
+    
     def __init__(self):
         """Initialize the eBay research service."""
         super().__init__()
-        self.api_key = os.getenv("EBAY_API_KEY")
-        self.terapeak_key = os.getenv("TERAPEAK_API_KEY")
-        self.base_url = "https://api.ebay.com"
-        self.terapeak_url = "https://api.terapeak.com"
+        self.api_key = EBAY_API_KEY
+        self.terapeak_key = TERAPEAK_API_KEY
     
     def get_ebay_data(self, item_id: str) -> Dict:
         """Get eBay Terapeak data.
@@ -34,32 +40,99 @@ class EbayResearch(BaseResearch):
             Dictionary containing eBay data
         """
         try:
-            # Get sold items data
-            sold_data = self._get_sold_items(item_id)
+            # Fetch sold items, active listings and watcher analysis concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                sold_future = executor.submit(self._get_sold_items, item_id)
+                active_future = executor.submit(self._get_active_listings, item_id)
+                watcher_future = executor.submit(self._get_watcher_analysis, item_id)
             
-            # Get active listings data
-            active_data = self._get_active_listings(item_id)
+            return self._format_ebay_data(
+                sold_future.result(),
+                active_future.result(),
+                watcher_future.result()
+            )
             
-            # Get watcher analysis
-            watcher_data = self._get_watcher_analysis(item_id)
+        except Exception as e:
+            logger.error(f"Failed to get eBay data for item {item_id}: {e}")
+            return {}
+    
+    def _get_ebay_data_serial(self, item_id: str) -> Dict:
+        """Get eBay Terapeak data with the three lookups made in turn.
+        
+        Used by get_ebay_batch, whose pool already runs items concurrently.
+        
+        Args:
+            item_id: eBay item ID
             
-            return {
-                "sold_stats": {
-                    "90d_volume": sold_data.get("volume", 0),
-                    "avg_price": sold_data.get("avg_price", 0.0),
-                    "price_distribution": sold_data.get("price_distribution", [])
-                },
-                "active_listings": {
-                    "count": active_data.get("count", 0),
-                    "watchers_total": watcher_data.get("total_watchers", 0),
-                    "promoted_pct": watcher_data.get("promoted_percentage", 0.0)
-                }
-            }
+        Returns:
+            Dictionary containing eBay data
+        """
+        try:
+            return self._format_ebay_data(
+                self._get_sold_items(item_id),
+                self._get_active_listings(item_id),
+                self._get_watcher_analysis(item_id)
+            )
             
         except Exception as e:
             logger.error(f"Failed to get eBay data for item {item_id}: {e}")
             return {}
     
+    def _format_ebay_data(self, sold_data: Dict, active_data: Dict, watcher_data: Dict) -> Dict:
+        """Combine Terapeak lookups into the eBay data format.
+        
+        Args:
+            sold_data: Sold items data
+            active_data: Active listings data
+            watcher_data: Watcher analysis data
+            
+        Returns:
+            Dictionary containing eBay data
+        """
+        return {
+            "sold_stats": {
+                "90d_volume": sold_data.get("volume", 0),
+                "avg_price": sold_data.get("avg_price", 0.0),
+                "price_distribution": sold_data.get("price_distribution", [])
+            },
+            "active_listings": {
+                "count": active_data.get("count", 0),
+                "watchers_total": watcher_data.get("total_watchers", 0),
+                "promoted_pct": watcher_data.get("promoted_percentage", 0.0)
+            }
+        }
+    
+    def get_ebay_batch(self, item_ids: List[str]) -> Dict[str, np.ndarray]:
+        """Get eBay Terapeak data for many items.
+        
+        Items are researched concurrently over the shared session, each
+        with its lookups made in turn so no nested pools are started.
+        Results are returned as one array per field, aligned with
+        ``item_ids``. Items that could not be researched have NaN values.
+        
+        Args:
+            item_ids: eBay item IDs
+            
+        Returns:
+            Dictionary of column arrays
+        """
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as executor:
+            results = list(executor.map(self._get_ebay_data_serial, item_ids))
+        
+        def column(section: str, field: str) -> np.ndarray:
+            return np.array(
+                [r[section][field] if r else np.nan for r in results], dtype=np.float64
+            )
+        
+        return {
+            "item_id": np.array(item_ids, dtype=str),
+            "90d_volume": column("sold_stats", "90d_volume"),
+            "avg_price": column("sold_stats", "avg_price"),
+            "active_count": column("active_listings", "count"),
+            "watchers_total": column("active_listings", "watchers_total"),
+            "promoted_pct": column("active_listings", "promoted_pct")
+        }
+    
     def _get_sold_items(self, item_id: str) -> Dict:
         """Get sold items data from Terapeak.
         
@@ -81,35 +154,31 @@ class EbayResearch(BaseResearch):
                 "include_details": True
             }
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.terapeak_url}/sold-items",
                 headers=headers,
-                params=params
+                params=params,
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Extract prices and trim outliers
-            prices = [item["price"] for item in data.get("items", [])]
+            prices = np.fromiter((item["price"] for item in data.get("items", [])), dtype=np.float64)
             valid_prices = self.trim_outliers(prices)
             
             # Calculate price distribution
-            if valid_prices:
-                min_price = min(valid_prices)
-                max_price = max(valid_prices)
-                step = (max_price - min_price) / 2
-                distribution = [
-                    min_price,
-                    sum(valid_prices) / len(valid_prices),
-                    max_price
-                ]
+            if valid_prices.size:
+                avg_price = float(valid_prices.mean())
+                distribution = [float(valid_prices.min()), avg_price, float(valid_prices.max())]
             else:
+                avg_price = 0.0
                 distribution = [0, 0, 0]
             
             return {
-                "volume": len(valid_prices),
-                "avg_price": sum(valid_prices) / len(valid_prices) if valid_prices else 0.0,
+                "volume": int(valid_prices.size),
+                "avg_price": avg_price,
                 "price_distribution": distribution
             }
             
@@ -137,14 +206,15 @@ class EbayResearch(BaseResearch):
                 "include_details": True
             }
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.terapeak_url}/active-listings",
                 headers=headers,
-                params=params
+                params=params,
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             return {"count": len(data.get("items", []))}
             
         except Exception as e:
@@ -171,19 +241,24 @@ class EbayResearch(BaseResearch):
                 "include_details": True
             }
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.terapeak_url}/watcher-analysis",
                 headers=headers,
-                params=params
+                params=params,
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Calculate total watchers and promoted percentage
-            total_watchers = sum(item["watchers"] for item in data.get("items", []))
-            promoted_items = sum(1 for item in data.get("items", []) if item.get("is_promoted"))
-            total_items = len(data.get("items", []))
+            items = data.get("items", [])
+            total_items = len(items)
+            total_watchers = 0
+            promoted_items = 0
+            for item in items:
+                total_watchers += item["watchers"]
+                promoted_items += bool(item.get("is_promoted"))
             
             promoted_percentage = (promoted_items / total_items * 100) if total_items > 0 else 0.0
             
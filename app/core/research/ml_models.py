@@ -1,21 +1,301 @@
 from typing import Dict, List, Optional, Tuple
 import logging
+import re
 import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler
 import xgboost as xgb
 import shap
+import treelite
+import treelite.sklearn
+import tl2cgen
 from datetime import datetime
+import time
+import threading
+from functools import lru_cache
+from cachetools import LRUCache
 import joblib
+import xxhash
+from numba import njit
 import os
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-class PricePredictor:
+# Keep the compiled predictors from pinning threads to cores inside each
+# worker process; read when a predictor's thread pool is created
+os.environ.setdefault("TREELITE_BIND_THREADS", "0")
+
+# Parallel compilation units used when compiling the price model to C
+TL2CGEN_PARALLEL_COMP = 8
+
+# Parallel compilation units for the larger return risk forest
+RETURN_RISK_PARALLEL_COMP = 16
+
+# Return probability thresholds for the high and medium risk categories
+HIGH_RETURN_RISK = 0.25
+MEDIUM_RETURN_RISK = 0.12
+
+# Compression for saved model and scaler artifacts
+ARTIFACT_COMPRESSION = ("lz4", 3)
+
+# Compiled predictors shared by every predictor instance in this process,
+# keyed by library path
+_compiled_predictors: Dict[str, tl2cgen.Predictor] = {}
+_compiled_predictors_lock = threading.Lock()
+
+# Seasonality feature for each calendar month, indexed by month - 1
+_SEASONALITY = np.sin(2 * np.pi * np.arange(1, 13) / 12)
+
+# Number of feature sets whose predictions each predictor keeps
+PREDICTION_CACHE_SIZE = 50_000
+
+# Damage mentions in item descriptions, matched without lowercasing a copy
+_DAMAGE_RE = re.compile(r"damage", re.IGNORECASE)
+
+# Number of buckets categorical strings are hashed into
+CATEGORY_HASH_BUCKETS = 1000
+
+@lru_cache(maxsize=1)
+def _month_for_minute(minute: int) -> int:
+    """Get the current calendar month, computed once per minute.
+    
+    Args:
+        minute: Minutes since the epoch, used as the cache key
+        
+    Returns:
+        Current month
+    """
+    return datetime.now().month
+
+def _current_month() -> int:
+    """Get the current calendar month without calling datetime.now() each time.
+    
+    Returns:
+        Current month
+    """
+    return _month_for_minute(int(time.time() // 60))
+
+def _load_compiled_predictor(lib_path: Path, reload: bool = False) -> Optional[tl2cgen.Predictor]:
+    """Get the process-wide compiled predictor for a shared library.
+    
+    Args:
+        lib_path: Path to the compiled model library
+        reload: Whether to replace an already loaded predictor
+        
+    Returns:
+        Shared predictor, or None if the library does not exist
+    """
+    key = str(lib_path)
+    with _compiled_predictors_lock:
+        if reload or key not in _compiled_predictors:
+            # Drop the old handle first so a replaced library is not
+            # served from the already loaded copy
+            _compiled_predictors.pop(key, None)
+            if not lib_path.exists():
+                return None
+            # Single thread per call avoids contention between request threads
+            _compiled_predictors[key] = tl2cgen.Predictor(key, nthread=1)
+        return _compiled_predictors[key]
+
+def _features_key(features: Dict) -> Optional[Tuple]:
+    """Build a prediction cache key from a feature dictionary.
+    
+    Args:
+        features: Dictionary of feature values
+        
+    Returns:
+        Hashable key, or None if a feature value is unhashable
+    """
+    key = tuple(sorted(features.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+def _stable_hash_mod(s: Optional[str], m: int = CATEGORY_HASH_BUCKETS) -> int:
+    """Hash a categorical string into a fixed bucket.
+    
+    Unlike the builtin hash(), which is randomized per process, this is
+    stable across processes so training and inference see the same codes.
+    
+    Args:
+        s: String to hash; None is treated as an empty string
+        m: Number of buckets
+        
+    Returns:
+        Bucket index
+    """
+    return xxhash.xxh64_intdigest((s or "").encode()) % m
+
+def _stable_hash_codes(values: List[Optional[str]], m: int = CATEGORY_HASH_BUCKETS) -> np.ndarray:
+    """Hash a column of categorical strings into fixed buckets.
+    
+    Args:
+        values: Strings to hash; None is treated as an empty string
+        m: Number of buckets
+        
+    Returns:
+        Array of bucket indices
+    """
+    return np.fromiter((_stable_hash_mod(s, m) for s in values), dtype=np.int64, count=len(values))
+
+def _pack_forest(model: RandomForestClassifier) -> Tuple[np.ndarray, ...]:
+    """Pack a binary random forest into padded per-tree node arrays.
+    
+    Args:
+        model: Fitted random forest classifier
+        
+    Returns:
+        Tuple of (left children, right children, split features, thresholds,
+        positive-class leaf probabilities), one row per tree
+    """
+    trees = [estimator.tree_ for estimator in model.estimators_]
+    n_trees = len(trees)
+    max_nodes = max(tree.node_count for tree in trees)
+    
+    children_left = np.full((n_trees, max_nodes), -1, dtype=np.int32)
+    children_right = np.full((n_trees, max_nodes), -1, dtype=np.int32)
+    feature = np.zeros((n_trees, max_nodes), dtype=np.int32)
+    threshold = np.zeros((n_trees, max_nodes), dtype=np.float64)
+    value = np.zeros((n_trees, max_nodes), dtype=np.float64)
+    
+    for t, tree in enumerate(trees):
+        n = tree.node_count
+        children_left[t, :n] = tree.children_left
+        children_right[t, :n] = tree.children_right
+        feature[t, :n] = np.maximum(tree.feature, 0)
+        threshold[t, :n] = tree.threshold
+        # Leaf class weights normalized to the positive-class probability
+        counts = tree.value[:, 0, :]
+        value[t, :n] = counts[:, -1] / counts.sum(axis=1)
+    
+    return children_left, children_right, feature, threshold, value
+
+@njit(cache=True, fastmath=True)
+def _rf_proba(children_left: np.ndarray, children_right: np.ndarray,
+              feature: np.ndarray, threshold: np.ndarray,
+              value: np.ndarray, x: np.ndarray) -> float:
+    """Average the positive-class probability of every tree for one row.
+    
+    Args:
+        children_left: Left child per node, -1 at leaves
+        children_right: Right child per node, -1 at leaves
+        feature: Split feature per node
+        threshold: Split threshold per node
+        value: Positive-class probability per node
+        x: Feature row
+        
+    Returns:
+        Positive-class probability
+    """
+    acc = 0.0
+    for t in range(children_left.shape[0]):
+        node = 0
+        while children_left[t, node] >= 0:
+            if x[feature[t, node]] <= threshold[t, node]:
+                node = children_left[t, node]
+            else:
+                node = children_right[t, node]
+        acc += value[t, node]
+    return acc / children_left.shape[0]
+
+class _CompiledModelMixin:
+    """Helpers shared by the compiled tree model predictors.
+    
+    Subclasses set scaler, lib_path, tl_predictor, _cache and _cache_lock,
+    name their model in _model_label for log messages, and give the
+    compiled model's threshold type in _threshold_dtype. Feature scaling,
+    compiled library export and loading, and cache clearing live here.
+    """
+    
+    _model_label = "model"
+    
+    def _set_scaler_stats(self) -> None:
+        """Cache the fitted scaler statistics as float32."""
+        self._mean = self.scaler.mean_.astype(np.float32)
+        self._scale = self.scaler.scale_.astype(np.float32)
+    
+    def _scale_features(self, X: np.ndarray) -> np.ndarray:
+        """Standardize feature rows in float32.
+        
+        Args:
+            X: Feature array
+            
+        Returns:
+            Scaled float32 feature array
+        """
+        return (X.astype(np.float32) - self._mean) / self._scale
+    
+    def _load_compiled_model(self, reload: bool = False) -> None:
+        """Load the compiled model if it has been exported.
+        
+        Args:
+            reload: Whether to reload the library after a new export
+        """
+        try:
+            self.tl_predictor = _load_compiled_predictor(self.lib_path, reload)
+        except Exception as e:
+            logger.error(f"Failed to load compiled {self._model_label}: {e}")
+            self.tl_predictor = None
+    
+    def _export_library(self, tl_model: treelite.Model, parallel_comp: int) -> None:
+        """Compile a Treelite model and swap it in for the current library.
+        
+        The library is built at a temporary path and moved over lib_path
+        with os.replace, so a library this process has mapped is never
+        rewritten in place.
+        
+        Args:
+            tl_model: Treelite model to compile
+            parallel_comp: Number of parallel compilation units
+        """
+        tmp_path = self.lib_path.with_name(f"{self.lib_path.stem}.{os.getpid()}.tmp{self.lib_path.suffix}")
+        try:
+            tl2cgen.export_lib(
+                tl_model,
+                toolchain="gcc",
+                libpath=str(tmp_path),
+                params={"parallel_comp": parallel_comp, "quantize": 1},
+                verbose=False
+            )
+            os.replace(tmp_path, self.lib_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        
+        # Release the old predictor before loading the replacement
+        self.tl_predictor = None
+        self._load_compiled_model(reload=True)
+    
+    def _compiled_dmatrix(self, X_scaled: np.ndarray) -> tl2cgen.DMatrix:
+        """Wrap scaled rows for the compiled model.
+        
+        tl2cgen rejects input whose type differs from the model's
+        threshold type, so rows are converted to _threshold_dtype.
+        
+        Args:
+            X_scaled: Scaled feature array
+            
+        Returns:
+            DMatrix in the compiled model's threshold type
+        """
+        return tl2cgen.DMatrix(X_scaled.astype(self._threshold_dtype, copy=False))
+    
+    def clear_cache(self) -> None:
+        """Drop all cached predictions."""
+        with self._cache_lock:
+            self._cache.clear()
+
+class PricePredictor(_CompiledModelMixin):
     """XGBoost model for price prediction."""
     
+    _model_label = "price model"
+    
+    # XGBoost splits are float32, and treelite keeps them as float32
+    _threshold_dtype = np.float32
+    
     def __init__(self):
         """Initialize the price predictor."""
         self.model = None
@@ -30,11 +310,79 @@ class PricePredictor:
         ]
         self.model_path = Path(__file__).parent / "models" / "price_predictor.joblib"
         self.scaler_path = Path(__file__).parent / "models" / "price_scaler.joblib"
+        self.lib_path = self.model_path.with_suffix(".so")
+        self.tl_predictor = None
+        self._mean = None
+        self._scale = None
+        self._cache = LRUCache(maxsize=PREDICTION_CACHE_SIZE)
+        self._cache_lock = threading.Lock()
         
         # Load model if exists
         if self.model_path.exists() and self.scaler_path.exists():
             self.model = joblib.load(self.model_path)
             self.scaler = joblib.load(self.scaler_path)
+            
+            # Artifacts saved before training moved to xgb.train hold an
+            # XGBRegressor; prediction and compilation need its Booster
+            if isinstance(self.model, xgb.XGBModel):
+                self.model = self.model.get_booster()
+            
+            self._set_scaler_stats()
+            self._load_compiled_model()
+        
+        # Build the SHAP explainer once per trained model
+        self._explainer = self._build_explainer()
+    
+    def _build_explainer(self) -> Optional[shap.TreeExplainer]:
+        """Build the SHAP explainer for the current model.
+        
+        Returns:
+            Tree explainer, or None if there is no model or SHAP cannot
+            explain it; predictions then carry empty feature importance
+        """
+        if self.model is None:
+            return None
+        
+        try:
+            return shap.TreeExplainer(self.model)
+        except Exception as e:
+            logger.error(f"Failed to build SHAP explainer: {e}")
+            return None
+    
+    def _export_compiled_model(self) -> None:
+        """Compile the trained XGBoost model to a shared library."""
+        try:
+            self._export_library(treelite.Model.from_xgboost(self.model), TL2CGEN_PARALLEL_COMP)
+        except Exception as e:
+            logger.error(f"Failed to compile price model: {e}")
+            self.tl_predictor = None
+    
+    def _predict_scaled(self, X_scaled: np.ndarray) -> np.ndarray:
+        """Predict prices for scaled feature rows.
+        
+        Args:
+            X_scaled: Scaled feature array
+            
+        Returns:
+            Array of predicted prices
+        """
+        if self.tl_predictor is not None:
+            dmat = self._compiled_dmatrix(X_scaled)
+            return np.ravel(self.tl_predictor.predict(dmat))
+        
+        return self.model.inplace_predict(X_scaled)
+    
+    def _cache_key(self, features: Dict) -> Optional[Tuple]:
+        """Build the prediction cache key for a feature dictionary.
+        
+        Args:
+            features: Dictionary of feature values
+            
+        Returns:
+            Hashable key including the current month, or None if uncacheable
+        """
+        key = _features_key(features)
+        return (_current_month(),) + key if key is not None else None
     
     def predict(self, features: Dict) -> Tuple[float, Dict]:
         """Predict price and get feature importance.
@@ -49,24 +397,111 @@ class PricePredictor:
             logger.error("Model not loaded")
             return 0.0, {}
         
+        if not isinstance(features, dict):
+            logger.error("Price features must be a dictionary")
+            return 0.0, {}
+        
         try:
-            # Prepare features
-            X = self._prepare_features(features)
-            
-            # Scale features
-            X_scaled = self.scaler.transform(X)
+            return self._predict_checked(features)
             
-            # Make prediction
-            prediction = self.model.predict(X_scaled)[0]
+        except Exception as e:
+            logger.error(f"Price prediction failed: {e}")
+            return 0.0, {}
+    
+    def _predict_checked(self, features: Dict) -> Tuple[float, Dict]:
+        """Predict price for a feature dictionary with the model loaded.
+        
+        Args:
+            features: Dictionary of feature values
             
-            # Get feature importance
-            importance = self._get_feature_importance(X_scaled)
+        Returns:
+            Tuple of (predicted price, feature importance)
+        """
+        key = self._cache_key(features)
+        if key is not None:
+            with self._cache_lock:
+                cached = self._cache.get(key)
+            if cached is not None:
+                return cached[0], dict(cached[1])
+        
+        # Prepare features
+        X = self._prepare_features(features)
+        
+        # Scale features
+        X_scaled = self._scale_features(X)
+        
+        # Make prediction
+        prediction = float(self._predict_scaled(X_scaled)[0])
+        
+        # Get feature importance
+        importance = self._get_feature_importance(X_scaled)
+        
+        if key is not None:
+            with self._cache_lock:
+                self._cache[key] = (prediction, dict(importance))
+        
+        return prediction, importance
+    
+    def predict_batch(self, features_list: List[Dict]) -> Tuple[np.ndarray, List[Dict]]:
+        """Predict prices and feature importance for many items at once.
+        
+        Args:
+            features_list: List of feature value dictionaries
             
-            return prediction, importance
+        Returns:
+            Tuple of (predicted prices, feature importance per item)
+        """
+        if self.model is None:
+            logger.error("Model not loaded")
+            return np.zeros(len(features_list)), [{} for _ in features_list]
+        
+        if not features_list:
+            return np.zeros(0), []
+        
+        if not all(isinstance(features, dict) for features in features_list):
+            logger.error("Price features must be dictionaries")
+            return np.zeros(len(features_list)), [{} for _ in features_list]
+        
+        try:
+            return self._predict_batch_checked(features_list)
             
         except Exception as e:
-            logger.error(f"Price prediction failed: {e}")
-            return 0.0, {}
+            logger.error(f"Batch price prediction failed: {e}")
+            return np.zeros(len(features_list)), [{} for _ in features_list]
+    
+    def _predict_batch_checked(self, features_list: List[Dict]) -> Tuple[np.ndarray, List[Dict]]:
+        """Predict prices for feature dictionaries with the model loaded.
+        
+        Args:
+            features_list: List of feature value dictionaries
+            
+        Returns:
+            Tuple of (predicted prices, feature importance per item)
+        """
+        # Serve repeated feature sets from the cache
+        keys = [self._cache_key(features) for features in features_list]
+        with self._cache_lock:
+            results = [self._cache.get(key) if key is not None else None for key in keys]
+        misses = [i for i, result in enumerate(results) if result is None]
+        
+        if misses:
+            # Stack prepared rows and scale them together
+            X = self._prepare_features_batch([features_list[i] for i in misses])
+            X_scaled = self._scale_features(X)
+            
+            predictions = self._predict_scaled(X_scaled)
+            importance = self._get_feature_importance_batch(X_scaled)
+            
+            with self._cache_lock:
+                for i, prediction, row_importance in zip(misses, predictions.tolist(), importance):
+                    results[i] = (prediction, row_importance)
+                    if keys[i] is not None:
+                        self._cache[keys[i]] = results[i]
+        
+        return (
+            np.array([result[0] for result in results]),
+            [dict(result[1]) for result in results]
+        )
     
     def train(self, data: pd.DataFrame) -> None:
         """Train the price prediction model.
@@ -76,25 +511,36 @@ class PricePredictor:
         """
         try:
             # Prepare features and target
-            X = data[self.feature_names]
-            y = data["price"]
+            X = np.ascontiguousarray(data[self.feature_names].to_numpy(dtype=np.float32))
+            y = np.asarray(data["price"], dtype=np.float32)
             
             # Scale features
-            X_scaled = self.scaler.fit_transform(X)
+            X_scaled = self.scaler.fit_transform(X).astype(np.float32, copy=False)
+            self._set_scaler_stats()
             
             # Train model
-            self.model = xgb.XGBRegressor(
-                objective="reg:squarederror",
-                n_estimators=100,
-                learning_rate=0.1,
-                max_depth=6
+            dtrain = xgb.DMatrix(X_scaled, label=y)
+            self.model = xgb.train(
+                {
+                    "objective": "reg:squarederror",
+                    "learning_rate": 0.1,
+                    "max_depth": 6,
+                    "tree_method": "hist"
+                },
+                dtrain,
+                num_boost_round=100
             )
-            self.model.fit(X_scaled, y)
             
             # Save model and scaler
             self.model_path.parent.mkdir(parents=True, exist_ok=True)
-            joblib.dump(self.model, self.model_path)
-            joblib.dump(self.scaler, self.scaler_path)
+            joblib.dump(self.model, self.model_path, compress=ARTIFACT_COMPRESSION)
+            joblib.dump(self.scaler, self.scaler_path, compress=ARTIFACT_COMPRESSION)
+            
+            # Compile for low-latency single-row scoring
+            self._export_compiled_model()
+            self.clear_cache()
+            
+            self._explainer = self._build_explainer()
             
         except Exception as e:
             logger.error(f"Model training failed: {e}")
@@ -108,27 +554,39 @@ class PricePredictor:
         Returns:
             Numpy array of prepared features
         """
+        return self._prepare_features_batch([features])
+    
+    def _prepare_features_batch(self, features_list: List[Dict]) -> np.ndarray:
+        """Prepare feature rows for a batch of predictions.
+        
+        Args:
+            features_list: List of feature value dictionaries
+            
+        Returns:
+            Numpy array with one row of prepared features per item
+        """
+        n = len(features_list)
+        
         # Convert categorical features to numeric
-        brand_encoded = hash(features.get("brand", "")) % 1000
-        category_encoded = hash(features.get("category", "")) % 1000
+        brand_encoded = _stable_hash_codes([f.get("brand", "") for f in features_list])
+        category_encoded = _stable_hash_codes([f.get("category", "") for f in features_list])
         
         # Get economic indicators
-        gdp_growth = features.get("gdp_growth", 0.0)
-        inflation_rate = features.get("inflation_rate", 0.0)
-        unemployment_rate = features.get("unemployment_rate", 0.0)
+        gdp_growth = np.fromiter((f.get("gdp_growth", 0.0) for f in features_list), dtype=np.float64, count=n)
+        inflation_rate = np.fromiter((f.get("inflation_rate", 0.0) for f in features_list), dtype=np.float64, count=n)
+        unemployment_rate = np.fromiter((f.get("unemployment_rate", 0.0) for f in features_list), dtype=np.float64, count=n)
         
         # Calculate seasonality
-        current_month = datetime.now().month
-        seasonality = np.sin(2 * np.pi * current_month / 12)
+        seasonality = np.full(n, _SEASONALITY[_current_month() - 1])
         
-        return np.array([[
+        return np.column_stack([
             brand_encoded,
             category_encoded,
             seasonality,
             gdp_growth,
             inflation_rate,
             unemployment_rate
-        ]])
+        ])
     
     def _get_feature_importance(self, X: np.ndarray) -> Dict:
         """Get feature importance using SHAP values.
@@ -139,9 +597,11 @@ class PricePredictor:
         Returns:
             Dictionary of feature importance
         """
+        if self._explainer is None:
+            return {}
+        
         try:
-            explainer = shap.TreeExplainer(self.model)
-            shap_values = explainer.shap_values(X)
+            shap_values = self._explainer.shap_values(X)
             
             importance = {}
             for i, feature in enumerate(self.feature_names):
@@ -152,11 +612,40 @@ class PricePredictor:
         except Exception as e:
             logger.error(f"Feature importance calculation failed: {e}")
             return {}
+    
+    def _get_feature_importance_batch(self, X: np.ndarray) -> List[Dict]:
+        """Get feature importance for every row with one SHAP call.
+        
+        Args:
+            X: Scaled feature array
+            
+        Returns:
+            List of feature importance dictionaries, one per row
+        """
+        if self._explainer is None:
+            return [{} for _ in range(len(X))]
+        
+        try:
+            shap_values = np.abs(self._explainer.shap_values(X))
+            
+            return [
+                dict(zip(self.feature_names, row.tolist()))
+                for row in shap_values
+            ]
+            
+        except Exception as e:
+            logger.error(f"Feature importance calculation failed: {e}")
+            return [{} for _ in range(len(X))]
 
 
-class ReturnRiskPredictor:
+class ReturnRiskPredictor(_CompiledModelMixin):
     """Random Forest model for return risk prediction."""
     
+    _model_label = "return risk model"
+    
+    # treelite imports scikit-learn thresholds as float64
+    _threshold_dtype = np.float64
+    
     def __init__(self):
         """Initialize the return risk predictor."""
         self.model = None
@@ -171,11 +660,52 @@ class ReturnRiskPredictor:
         ]
         self.model_path = Path(__file__).parent / "models" / "return_risk.joblib"
         self.scaler_path = Path(__file__).parent / "models" / "return_risk_scaler.joblib"
+        self.lib_path = self.model_path.with_suffix(".so")
+        self.tl_predictor = None
+        self._mean = None
+        self._scale = None
+        self._cache = LRUCache(maxsize=PREDICTION_CACHE_SIZE)
+        self._cache_lock = threading.Lock()
+        self._forest = None
         
         # Load model if exists
         if self.model_path.exists() and self.scaler_path.exists():
             self.model = joblib.load(self.model_path)
             self.scaler = joblib.load(self.scaler_path)
+            self._set_scaler_stats()
+            self._load_compiled_model()
+            self._forest = _pack_forest(self.model)
+    
+    def _export_compiled_model(self) -> None:
+        """Compile the trained random forest to a shared library."""
+        try:
+            self._export_library(treelite.sklearn.import_model(self.model), RETURN_RISK_PARALLEL_COMP)
+        except Exception as e:
+            logger.error(f"Failed to compile return risk model: {e}")
+            self.tl_predictor = None
+    
+    def _predict_proba_scaled(self, X_scaled: np.ndarray) -> np.ndarray:
+        """Predict return probabilities for scaled feature rows.
+        
+        Args:
+            X_scaled: Scaled feature array
+            
+        Returns:
+            Array of return probabilities
+        """
+        if self.tl_predictor is not None:
+            dmat = self._compiled_dmatrix(X_scaled)
+            proba = np.asarray(self.tl_predictor.predict(dmat)).reshape(len(X_scaled), -1)
+            # Binary forests may report one column or one per class
+            return proba[:, -1]
+        
+        # Walk the packed trees directly for single rows
+        if self._forest is not None and len(X_scaled) == 1:
+            # Trees compare float32 features, as sklearn does
+            x = X_scaled[0].astype(np.float32).astype(np.float64)
+            return np.array([_rf_proba(*self._forest, x)])
+        
+        return self.model.predict_proba(X_scaled)[:, 1]
     
     def predict(self, features: Dict) -> Tuple[str, float]:
         """Predict return risk.
@@ -190,29 +720,119 @@ class ReturnRiskPredictor:
             logger.error("Model not loaded")
             return "Unknown", 0.0
         
+        if not isinstance(features, dict):
+            logger.error("Return risk features must be a dictionary")
+            return "Unknown", 0.0
+        
         try:
-            # Prepare features
-            X = self._prepare_features(features)
+            return self._predict_checked(features)
             
-            # Scale features
-            X_scaled = self.scaler.transform(X)
-            
-            # Make prediction
-            probability = self.model.predict_proba(X_scaled)[0][1]
+        except Exception as e:
+            logger.error(f"Return risk prediction failed: {e}")
+            return "Unknown", 0.0
+    
+    def _predict_checked(self, features: Dict) -> Tuple[str, float]:
+        """Predict return risk for a feature dictionary with the model loaded.
+        
+        Args:
+            features: Dictionary of feature values
             
-            # Determine risk category
-            if probability > 0.25:
-                category = "High"
-            elif probability > 0.12:
-                category = "Medium"
-            else:
-                category = "Low"
+        Returns:
+            Tuple of (risk category, probability)
+        """
+        key = _features_key(features)
+        if key is not None:
+            with self._cache_lock:
+                cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        
+        # Prepare features
+        X = self._prepare_features(features)
+        
+        # Scale features
+        X_scaled = self._scale_features(X)
+        
+        # Make prediction
+        probability = float(self._predict_proba_scaled(X_scaled)[0])
+        
+        # Determine risk category
+        if probability > HIGH_RETURN_RISK:
+            category = "High"
+        elif probability > MEDIUM_RETURN_RISK:
+            category = "Medium"
+        else:
+            category = "Low"
+        
+        if key is not None:
+            with self._cache_lock:
+                self._cache[key] = (category, probability)
+        
+        return category, probability
+    
+    def predict_batch(self, features_list: List[Dict]) -> Tuple[List[str], np.ndarray]:
+        """Predict return risk for many items at once.
+        
+        Args:
+            features_list: List of feature value dictionaries
             
-            return category, probability
+        Returns:
+            Tuple of (risk categories, probabilities)
+        """
+        if self.model is None:
+            logger.error("Model not loaded")
+            return ["Unknown"] * len(features_list), np.zeros(len(features_list))
+        
+        if not features_list:
+            return [], np.zeros(0)
+        
+        if not all(isinstance(features, dict) for features in features_list):
+            logger.error("Return risk features must be dictionaries")
+            return ["Unknown"] * len(features_list), np.zeros(len(features_list))
+        
+        try:
+            return self._predict_batch_checked(features_list)
             
         except Exception as e:
-            logger.error(f"Return risk prediction failed: {e}")
-            return "Unknown", 0.0
+            logger.error(f"Batch return risk prediction failed: {e}")
+            return ["Unknown"] * len(features_list), np.zeros(len(features_list))
+    
+    def _predict_batch_checked(self, features_list: List[Dict]) -> Tuple[List[str], np.ndarray]:
+        """Predict return risk for feature dictionaries with the model loaded.
+        
+        Args:
+            features_list: List of feature value dictionaries
+            
+        Returns:
+            Tuple of (risk categories, probabilities)
+        """
+        # Serve repeated feature sets from the cache
+        keys = [_features_key(features) for features in features_list]
+        with self._cache_lock:
+            results = [self._cache.get(key) if key is not None else None for key in keys]
+        misses = [i for i, result in enumerate(results) if result is None]
+        
+        if misses:
+            # Stack prepared rows and scale them together
+            X = self._prepare_features_batch([features_list[i] for i in misses])
+            X_scaled = self._scale_features(X)
+            
+            probabilities = self._predict_proba_scaled(X_scaled)
+            
+            # Determine risk categories
+            categories = np.select(
+                [probabilities > HIGH_RETURN_RISK, probabilities > MEDIUM_RETURN_RISK],
+                ["High", "Medium"],
+                default="Low"
+            )
+            
+            with self._cache_lock:
+                for i, category, probability in zip(misses, categories.tolist(), probabilities.tolist()):
+                    results[i] = (category, probability)
+                    if keys[i] is not None:
+                        self._cache[keys[i]] = results[i]
+        
+        return [result[0] for result in results], np.array([result[1] for result in results])
     
     def train(self, data: pd.DataFrame) -> None:
         """Train the return risk prediction model.
@@ -222,11 +842,12 @@ class ReturnRiskPredictor:
         """
         try:
             # Prepare features and target
-            X = data[self.feature_names]
-            y = data["returned"]
+            X = np.ascontiguousarray(data[self.feature_names].to_numpy(dtype=np.float32))
+            y = np.asarray(data["returned"], dtype=np.int8)
             
             # Scale features
-            X_scaled = self.scaler.fit_transform(X)
+            X_scaled = self.scaler.fit_transform(X).astype(np.float32, copy=False)
+            self._set_scaler_stats()
             
             # Train model
             self.model = RandomForestClassifier(
@@ -235,11 +856,16 @@ class ReturnRiskPredictor:
                 random_state=42
             )
             self.model.fit(X_scaled, y)
+            self._forest = _pack_forest(self.model)
             
             # Save model and scaler
             self.model_path.parent.mkdir(parents=True, exist_ok=True)
-            joblib.dump(self.model, self.model_path)
-            joblib.dump(self.scaler, self.scaler_path)
+            joblib.dump(self.model, self.model_path, compress=ARTIFACT_COMPRESSION)
+            joblib.dump(self.scaler, self.scaler_path, compress=ARTIFACT_COMPRESSION)
+            
+            # Compile for low-latency single-row scoring
+            self._export_compiled_model()
+            self.clear_cache()
             
         except Exception as e:
             logger.error(f"Model training failed: {e}")
@@ -253,26 +879,43 @@ class ReturnRiskPredictor:
         Returns:
             Numpy array of prepared features
         """
+        return self._prepare_features_batch([features])
+    
+    def _prepare_features_batch(self, features_list: List[Dict]) -> np.ndarray:
+        """Prepare feature rows for a batch of predictions.
+        
+        Args:
+            features_list: List of feature value dictionaries
+            
+        Returns:
+            Numpy array with one row of prepared features per item
+        """
+        n = len(features_list)
+        
         # Convert categorical features to numeric
-        product_type_encoded = hash(features.get("product_type", "")) % 1000
-        condition_encoded = hash(features.get("condition", "")) % 1000
+        product_type_encoded = _stable_hash_codes([f.get("product_type", "") for f in features_list])
+        condition_encoded = _stable_hash_codes([f.get("condition", "") for f in features_list])
         
         # Get seller rating
-        seller_rating = features.get("seller_rating", 0.0)
+        seller_rating = np.fromiter((f.get("seller_rating", 0.0) for f in features_list), dtype=np.float64, count=n)
         
         # Get description features
-        description = features.get("description", "")
-        description_length = len(description)
-        has_damage_notes = 1 if "damage" in description.lower() else 0
+        descriptions = [f.get("description", "") for f in features_list]
+        description_length = np.fromiter((len(d) for d in descriptions), dtype=np.int64, count=n)
+        has_damage_notes = np.fromiter(
+            (_DAMAGE_RE.search(d) is not None for d in descriptions), dtype=np.int64, count=n
+        )
         
         # Get returns information
-        has_returns_accepted = 1 if features.get("returns_accepted", False) else 0
+        has_returns_accepted = np.fromiter(
+            (bool(f.get("returns_accepted", False)) for f in features_list), dtype=np.int64, count=n
+        )
         
-        return np.array([[
+        return np.column_stack([
             product_type_encoded,
             condition_encoded,
             seller_rating,
             description_length,
             has_damage_notes,
             has_returns_accepted
-        ]]) 
\ No newline at end of file
+        ])
@@ -22,6 +22,13 @@ class ResearchService:
         self.ebay_research = EbayResearch()
         self.price_predictor = PricePredictor()
         self.return_risk_predictor = ReturnRiskPredictor()
+        
+        # Economic indicators, replaced as a whole on update
+        self._econ = {
+            "gdp_growth": float(os.getenv("GDP_GROWTH", "0.0")),
+            "inflation_rate": float(os.getenv("INFLATION_RATE", "0.0")),
+            "unemployment_rate": float(os.getenv("UNEMPLOYMENT_RATE", "0.0"))
+        }
     
     def research_product(self, 
                         upc: Optional[str] = None,
@@ -63,23 +70,11 @@ class ResearchService:
                 ebay_data = self.ebay_research.get_ebay_data(ebay_id)
             
             # Get price prediction
-            price_features = {
-                "brand": brand,
-                "category": category,
-                "gdp_growth": float(os.getenv("GDP_GROWTH", "0.0")),
-                "inflation_rate": float(os.getenv("INFLATION_RATE", "0.0")),
-                "unemployment_rate": float(os.getenv("UNEMPLOYMENT_RATE", "0.0"))
-            }
+            price_features = self._price_features(brand, category)
             predicted_price, price_importance = self.price_predictor.predict(price_features)
             
             # Get return risk prediction
-            risk_features = {
-                "product_type": category,
-                "condition": "Used",  # Default to used for auction items
-                "seller_rating": 0.0,  # Will be updated if available
-                "description": "",  # Will be updated if available
-                "returns_accepted": True  # Default to True for auction items
-            }
+            risk_features = self._risk_features(category)
             risk_category, risk_probability = self.return_risk_predictor.predict(risk_features)
             
             # Format output
@@ -103,6 +98,100 @@ class ResearchService:
             logger.error(f"Product research failed: {e}")
             return {}
     
+    def research_products(self, products: List[Dict]) -> List[Dict]:
+        """Research several products, scoring all predictions in one batch.
+        
+        Args:
+            products: List of dictionaries with optional upc, brand, model,
+                category, asin and ebay_id keys
+            
+        Returns:
+            List of research results in the same order as products
+        """
+        try:
+            results = []
+            for product in products:
+                # Check database for similar items
+                similar_items = self.amazon_research.check_database(
+                    upc=product.get("upc"),
+                    brand=product.get("brand"),
+                    model=product.get("model"),
+                    category=product.get("category")
+                )
+                
+                # Get marketplace data where IDs were provided
+                asin = product.get("asin")
+                ebay_id = product.get("ebay_id")
+                
+                results.append({
+                    "similar_items": similar_items,
+                    "amazon_data": self.amazon_research.get_amazon_data(asin) if asin else {},
+                    "ebay_data": self.ebay_research.get_ebay_data(ebay_id) if ebay_id else {}
+                })
+            
+            # Score every product with one call per model
+            predicted_prices, price_importance = self.price_predictor.predict_batch([
+                self._price_features(product.get("brand"), product.get("category"))
+                for product in products
+            ])
+            risk_categories, risk_probabilities = self.return_risk_predictor.predict_batch([
+                self._risk_features(product.get("category"))
+                for product in products
+            ])
+            
+            for result, price, importance, risk_category, risk_probability in zip(
+                results, predicted_prices, price_importance, risk_categories, risk_probabilities
+            ):
+                result["predictions"] = {
+                    "price": {
+                        "predicted": float(price),
+                        "importance": importance
+                    },
+                    "return_risk": {
+                        "category": risk_category,
+                        "probability": float(risk_probability)
+                    }
+                }
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Batch product research failed: {e}")
+            return []
+    
+    def _price_features(self, brand: Optional[str], category: Optional[str]) -> Dict:
+        """Build price prediction features for a product.
+        
+        Args:
+            brand: Brand name
+            category: Category
+            
+        Returns:
+            Dictionary of price features
+        """
+        return {
+            "brand": brand,
+            "category": category,
+            **self._econ
+        }
+    
+    def _risk_features(self, category: Optional[str]) -> Dict:
+        """Build return risk features for a product.
+        
+        Args:
+            category: Category
+            
+        Returns:
+            Dictionary of return risk features
+        """
+        return {
+            "product_type": category,
+            "condition": "Used",  # Default to used for auction items
+            "seller_rating": 0.0,  # Will be updated if available
+            "description": "",  # Will be updated if available
+            "returns_accepted": True  # Default to True for auction items
+        }
+    
     def train_models(self, price_data: List[Dict], return_data: List[Dict]) -> None:
         """Train the machine learning models.
         
@@ -134,6 +223,13 @@ class ResearchService:
             unemployment_rate: Unemployment rate
         """
         try:
+            self._econ = {
+                "gdp_growth": float(gdp_growth),
+                "inflation_rate": float(inflation_rate),
+                "unemployment_rate": float(unemployment_rate)
+            }
+            self.price_predictor.clear_cache()
+            
             os.environ["GDP_GROWTH"] = str(gdp_growth)
             os.environ["INFLATION_RATE"] = str(inflation_rate)
             os.environ["UNEMPLOYMENT_RATE"] = str(unemployment_rate)
@@ -159,11 +255,7 @@ class ResearchService:
                         "features": self.return_risk_predictor.feature_names
                     }
                 },
-                "economic_indicators": {
-                    "gdp_growth": float(os.getenv("GDP_GROWTH", "0.0")),
-                    "inflation_rate": float(os.getenv("INFLATION_RATE", "0.0")),
-                    "unemployment_rate": float(os.getenv("UNEMPLOYMENT_RATE", "0.0"))
-                }
+                "economic_indicators": dict(self._econ)
             }
             
         except Exception as e:
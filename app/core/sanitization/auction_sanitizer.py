@@ -1,15 +1,40 @@
 from typing import Dict, List, Optional, Union
 import logging
+from functools import partial
 from datetime import datetime, timedelta
 from decimal import Decimal
+import pandas as pd
 
 from .base_sanitizer import BaseSanitizer
 
 logger = logging.getLogger(__name__)
 
+# Fields every auction must provide
+REQUIRED_FIELDS = ['auction_id', 'title', 'current_bid', 'end_time']
+
+# Fields read from raw auction data
+AUCTION_FIELDS = REQUIRED_FIELDS + [
+    'description', 'category', 'condition', 'buy_it_now', 'start_time',
+    'seller_id', 'seller_rating', 'location', 'shipping_info', 'upc', 'images'
+]
+
+# Identifier and free-text fields as (field, column kernel name, always included)
+TEXT_SCHEMA = (
+    ('auction_id', 'prevent_sql_injection_series', True),
+    ('title', 'sanitize_text_series', True),
+    ('description', 'sanitize_text_series', True),
+    ('category', 'sanitize_text_series', True),
+    ('condition', 'sanitize_text_series', True),
+    ('seller_id', 'prevent_sql_injection_series', False),
+    ('location', 'sanitize_text_series', False),
+    ('shipping_info', 'sanitize_text_series', False)
+)
+
 class AuctionSanitizer(BaseSanitizer):
     """Sanitizer for auction data."""
     
+    __slots__ = ('_text_schema',)
+    
     def __init__(self):
         """Initialize the auction sanitizer."""
         super().__init__()
@@ -21,6 +46,17 @@ class AuctionSanitizer(BaseSanitizer):
             'location': 100,
             'shipping_info': 500
         })
+        
+        # Bind each field's column kernel and length limit once
+        self._text_schema = tuple(
+            (
+                field,
+                partial(self.sanitize_text_series, limit=self.field_limits.get(field, 1000))
+                if kernel == 'sanitize_text_series' else getattr(self, kernel),
+                always
+            )
+            for field, kernel, always in TEXT_SCHEMA
+        )
     
     def sanitize_auction(self, auction_data: Dict) -> Dict:
         """Sanitize auction data.
@@ -31,87 +67,80 @@ class AuctionSanitizer(BaseSanitizer):
         Returns:
             Sanitized auction data
         """
+        results = self.sanitize_auctions([auction_data])
+        return results[0] if results else {}
+    
+    def sanitize_auctions(self, auctions: List[Dict]) -> List[Dict]:
+        """Sanitize a batch of auctions column by column.
+        
+        Args:
+            auctions: Auction data to sanitize
+            
+        Returns:
+            Sanitized auction data in input order, with an empty dict for
+            each auction that failed validation
+        """
         try:
-            sanitized = {}
+            if not auctions:
+                return []
+            
+            df = pd.DataFrame.from_records(auctions).reindex(columns=AUCTION_FIELDS)
+            present = df.notna()
             
             # Required fields
-            required_fields = ['auction_id', 'title', 'current_bid', 'end_time']
-            for field in required_fields:
-                if field not in auction_data:
-                    logger.error(f"Missing required field: {field}")
-                    return {}
-            
-            # Sanitize basic fields
-            sanitized['auction_id'] = self.prevent_sql_injection(auction_data['auction_id'])
-            sanitized['title'] = self.sanitize_text(auction_data['title'], 'title')
-            sanitized['description'] = self.sanitize_text(auction_data.get('description', ''), 'description')
-            sanitized['category'] = self.sanitize_text(auction_data.get('category', ''), 'category')
-            sanitized['condition'] = self.sanitize_text(auction_data.get('condition', ''), 'condition')
+            valid = present[REQUIRED_FIELDS].all(axis=1)
+            if not valid.all():
+                logger.error(f"Missing required fields in {int((~valid).sum())} auctions")
             
             # Sanitize price fields
-            current_bid = self.sanitize_price(auction_data['current_bid'])
-            if not current_bid:
-                logger.error("Invalid current bid")
-                return {}
-            sanitized['current_bid'] = current_bid
-            
-            if 'buy_it_now' in auction_data:
-                buy_it_now = self.sanitize_price(auction_data['buy_it_now'])
-                if buy_it_now:
-                    sanitized['buy_it_now'] = buy_it_now
+            current_bid = self.sanitize_price_series(df['current_bid'])
+            invalid_bid = valid & current_bid.isna()
+            if invalid_bid.any():
+                logger.error(f"Invalid current bid in {int(invalid_bid.sum())} auctions")
+            valid &= ~invalid_bid
+            buy_it_now = self.sanitize_price_series(df['buy_it_now'])
             
             # Sanitize dates
-            end_time = self.sanitize_date(auction_data['end_time'])
-            if not end_time:
-                logger.error("Invalid end time")
-                return {}
-            sanitized['end_time'] = end_time
-            
-            if 'start_time' in auction_data:
-                start_time = self.sanitize_date(auction_data['start_time'])
-                if start_time:
-                    sanitized['start_time'] = start_time
-            
-            # Sanitize seller info
-            if 'seller_id' in auction_data:
-                sanitized['seller_id'] = self.prevent_sql_injection(auction_data['seller_id'])
-            
-            if 'seller_rating' in auction_data:
-                try:
-                    rating = float(auction_data['seller_rating'])
-                    if 0 <= rating <= 5:
-                        sanitized['seller_rating'] = rating
-                except (ValueError, TypeError):
-                    pass
-            
-            # Sanitize location
-            if 'location' in auction_data:
-                sanitized['location'] = self.sanitize_text(auction_data['location'], 'location')
-            
-            # Sanitize shipping info
-            if 'shipping_info' in auction_data:
-                sanitized['shipping_info'] = self.sanitize_text(auction_data['shipping_info'], 'shipping_info')
-            
-            # Sanitize UPC
-            if 'upc' in auction_data:
-                upc = self.sanitize_upc(auction_data['upc'])
-                if upc:
-                    sanitized['upc'] = upc
-            
-            # Sanitize images
-            if 'images' in auction_data:
-                sanitized_images = []
-                for image_url in auction_data['images']:
-                    if self.verify_image_url(image_url):
-                        sanitized_images.append(image_url)
-                if sanitized_images:
-                    sanitized['images'] = sanitized_images
-            
-            return sanitized
+            now = self._now()
+            end_time = self.sanitize_date_series(df['end_time'], now)
+            invalid_end = valid & end_time.isna()
+            if invalid_end.any():
+                logger.error(f"Invalid end time in {int(invalid_end.sum())} auctions")
+            valid &= ~invalid_end
+            start_time = self.sanitize_date_series(df['start_time'], now)
+            
+            # Sanitize text and identifier fields
+            required = {}
+            optional = {}
+            for field, kernel, always in self._text_schema:
+                if always:
+                    required[field] = kernel(df[field]).tolist()
+                else:
+                    optional[field] = kernel(df[field]).where(present[field])
+            
+            # Sanitize seller rating and UPC
+            rating = pd.to_numeric(df['seller_rating'], errors='coerce')
+            rating = rating.where((rating >= 0) & (rating <= 5))
+            
+            # Optional fields kept only when provided and valid
+            optional.update({
+                'buy_it_now': buy_it_now,
+                'start_time': start_time.dt.to_pydatetime(),
+                'seller_rating': rating,
+                'upc': self.sanitize_upc_series(df['upc'])
+            })
+            
+            # Assemble records
+            required.update({
+                'current_bid': current_bid.tolist(),
+                'end_time': list(end_time.dt.to_pydatetime())
+            })
+            
+            return self.build_records(valid, required, optional, df['images'])
             
         except Exception as e:
             logger.error(f"Auction sanitization failed: {e}")
-            return {}
+            return [{} for _ in auctions]
     
     def validate_bid(self, bid: Union[str, float, Decimal], current_bid: Decimal) -> Optional[Decimal]:
         """Validate bid amount.
@@ -146,24 +175,27 @@ class AuctionSanitizer(BaseSanitizer):
             logger.error(f"Bid validation failed: {e}")
             return None
     
-    def validate_auction_time(self, end_time: datetime) -> bool:
+    def validate_auction_time(self, end_time: datetime, now: Optional[datetime] = None) -> bool:
         """Validate auction end time.
         
         Args:
             end_time: Auction end time
+            now: Current time; defaults to the per-second cached time
             
         Returns:
             True if valid
         """
         try:
+            now = now or self._now()
+            
             # Check if in future
-            if end_time <= datetime.now():
+            if end_time <= now:
                 logger.warning("Auction end time must be in the future")
                 return False
             
             # Check if within reasonable range (e.g., 30 days)
             max_duration = timedelta(days=30)
-            if end_time > datetime.now() + max_duration:
+            if end_time > now + max_duration:
                 logger.warning("Auction duration too long")
                 return False
             
@@ -1,15 +1,73 @@
 from typing import Dict, List, Optional, Union
 import logging
+import numbers
+from functools import partial
 from datetime import datetime, timedelta
 from decimal import Decimal
+import numpy as np
+import pandas as pd
 
 from .base_sanitizer import BaseSanitizer
 
 logger = logging.getLogger(__name__)
 
+# Fields every market record must provide
+REQUIRED_FIELDS = ['product_id', 'title', 'price', 'timestamp']
+
+# Fields read from raw market data
+MARKET_FIELDS = REQUIRED_FIELDS + [
+    'description', 'category', 'brand', 'model', 'seller_id',
+    'seller_rating', 'sales_rank', 'upc', 'images'
+]
+
+# Identifier and free-text fields as (field, column kernel name, always included)
+TEXT_SCHEMA = (
+    ('product_id', 'prevent_sql_injection_series', True),
+    ('title', 'sanitize_text_series', True),
+    ('description', 'sanitize_text_series', True),
+    ('category', 'sanitize_text_series', True),
+    ('brand', 'sanitize_text_series', True),
+    ('model', 'sanitize_text_series', True),
+    ('seller_id', 'prevent_sql_injection_series', False)
+)
+
+# Maximum relative difference between eBay and Amazon prices
+PRICE_CORRELATION_THRESHOLD = Decimal('0.30')
+
+# Free-text fields included in every record, empty when missing
+DEFAULTED_TEXT_FIELDS = ('description', 'category', 'brand', 'model')
+
+# Optional numeric fields as (field, type, minimum, maximum or None)
+BOUNDED_FIELDS = (
+    ('seller_rating', float, 0, 5),
+    ('sales_rank', int, 1, None)
+)
+
+def _parse_bounded(value, caster, lo, hi):
+    """Parse a value and check it against inclusive bounds.
+    
+    Args:
+        value: Raw value
+        caster: Type to parse the value as
+        lo: Minimum allowed value
+        hi: Maximum allowed value, or None for no maximum
+        
+    Returns:
+        Parsed value or None if unparseable or out of bounds
+    """
+    try:
+        parsed = caster(value)
+    except (ValueError, TypeError):
+        return None
+    if parsed < lo or (hi is not None and parsed > hi):
+        return None
+    return parsed
+
 class MarketSanitizer(BaseSanitizer):
     """Sanitizer for market data."""
     
+    __slots__ = ('_text_schema',)
+    
     def __init__(self):
         """Initialize the market sanitizer."""
         super().__init__()
@@ -21,15 +79,26 @@ class MarketSanitizer(BaseSanitizer):
             'model': 50,
             'seller_id': 50
         })
+        
+        # Bind each field's column kernel and length limit once
+        self._text_schema = tuple(
+            (
+                field,
+                partial(self.sanitize_text_series, limit=self.field_limits.get(field, 1000))
+                if kernel == 'sanitize_text_series' else getattr(self, kernel),
+                always
+            )
+            for field, kernel, always in TEXT_SCHEMA
+        )
     
-    def sanitize_market_data(self, market_data: Dict) -> Dict:
+    def sanitize_market_data(self, market_data: Dict) -> Optional[Dict]:
         """Sanitize market data.
         
         Args:
             market_data: Market data to sanitize
             
         Returns:
-            Sanitized market data
+            Sanitized market data or None if invalid
         """
         try:
             sanitized = {}
@@ -39,50 +108,38 @@ class MarketSanitizer(BaseSanitizer):
             for field in required_fields:
                 if field not in market_data:
                     logger.error(f"Missing required field: {field}")
-                    return {}
+                    return None
             
             # Sanitize basic fields
             sanitized['product_id'] = self.prevent_sql_injection(market_data['product_id'])
             sanitized['title'] = self.sanitize_text(market_data['title'], 'title')
-            sanitized['description'] = self.sanitize_text(market_data.get('description', ''), 'description')
-            sanitized['category'] = self.sanitize_text(market_data.get('category', ''), 'category')
-            sanitized['brand'] = self.sanitize_text(market_data.get('brand', ''), 'brand')
-            sanitized['model'] = self.sanitize_text(market_data.get('model', ''), 'model')
+            for field in DEFAULTED_TEXT_FIELDS:
+                sanitized[field] = self.sanitize_text(market_data.get(field, ''), field)
             
             # Sanitize price
             price = self.sanitize_price(market_data['price'])
             if not price:
                 logger.error("Invalid price")
-                return {}
+                return None
             sanitized['price'] = price
             
             # Sanitize timestamp
             timestamp = self.sanitize_date(market_data['timestamp'])
             if not timestamp:
                 logger.error("Invalid timestamp")
-                return {}
+                return None
             sanitized['timestamp'] = timestamp
             
             # Sanitize seller info
             if 'seller_id' in market_data:
                 sanitized['seller_id'] = self.prevent_sql_injection(market_data['seller_id'])
             
-            if 'seller_rating' in market_data:
-                try:
-                    rating = float(market_data['seller_rating'])
-                    if 0 <= rating <= 5:
-                        sanitized['seller_rating'] = rating
-                except (ValueError, TypeError):
-                    pass
-            
-            # Sanitize sales rank
-            if 'sales_rank' in market_data:
-                try:
-                    rank = int(market_data['sales_rank'])
-                    if rank > 0:
-                        sanitized['sales_rank'] = rank
-                except (ValueError, TypeError):
-                    pass
+            # Sanitize seller rating and sales rank
+            for field, caster, lo, hi in BOUNDED_FIELDS:
+                if field in market_data:
+                    value = _parse_bounded(market_data[field], caster, lo, hi)
+                    if value is not None:
+                        sanitized[field] = value
             
             # Sanitize UPC
             if 'upc' in market_data:
@@ -92,10 +149,7 @@ class MarketSanitizer(BaseSanitizer):
             
             # Sanitize images
             if 'images' in market_data:
-                sanitized_images = []
-                for image_url in market_data['images']:
-                    if self.verify_image_url(image_url):
-                        sanitized_images.append(image_url)
+                sanitized_images = self.verify_image_urls(market_data['images'])
                 if sanitized_images:
                     sanitized['images'] = sanitized_images
             
@@ -103,9 +157,77 @@ class MarketSanitizer(BaseSanitizer):
             
         except Exception as e:
             logger.error(f"Market data sanitization failed: {e}")
-            return {}
+            return None
+    
+    def sanitize_market_data_batch(self, records: List[Dict]) -> List[Dict]:
+        """Sanitize a batch of market records column by column.
+        
+        Args:
+            records: Market data to sanitize
+            
+        Returns:
+            Sanitized market data in input order, with an empty dict for
+            each record that failed validation
+        """
+        try:
+            if not records:
+                return []
+            
+            df = pd.DataFrame.from_records(records).reindex(columns=MARKET_FIELDS)
+            present = df.notna()
+            
+            # Required fields
+            valid = present[REQUIRED_FIELDS].all(axis=1)
+            if not valid.all():
+                logger.error(f"Missing required fields in {int((~valid).sum())} market records")
+            
+            # Sanitize price
+            price = self.sanitize_price_series(df['price'])
+            invalid_price = valid & price.isna()
+            if invalid_price.any():
+                logger.error(f"Invalid price in {int(invalid_price.sum())} market records")
+            valid &= ~invalid_price
+            
+            # Sanitize timestamp
+            timestamp = self.sanitize_date_series(df['timestamp'])
+            invalid_timestamp = valid & timestamp.isna()
+            if invalid_timestamp.any():
+                logger.error(f"Invalid timestamp in {int(invalid_timestamp.sum())} market records")
+            valid &= ~invalid_timestamp
+            
+            # Sanitize text and identifier fields
+            required = {}
+            optional = {}
+            for field, kernel, always in self._text_schema:
+                if always:
+                    required[field] = kernel(df[field]).tolist()
+                else:
+                    optional[field] = kernel(df[field]).where(present[field])
+            
+            # Sanitize seller rating, sales rank and UPC
+            rating = pd.to_numeric(df['seller_rating'], errors='coerce')
+            rank = pd.to_numeric(df['sales_rank'], errors='coerce')
+            
+            # Optional fields kept only when provided and valid
+            optional.update({
+                'seller_rating': rating.where((rating >= 0) & (rating <= 5)),
+                'sales_rank': (rank.where(rank >= 1) // 1).astype('Int64'),
+                'upc': self.sanitize_upc_series(df['upc'])
+            })
+            
+            # Assemble records
+            required.update({
+                'price': price.tolist(),
+                'timestamp': list(timestamp.dt.to_pydatetime())
+            })
+            
+            return self.build_records(valid, required, optional, df['images'])
+            
+        except Exception as e:
+            logger.error(f"Market data sanitization failed: {e}")
+            return [{} for _ in records]
     
-    def validate_price_correlation(self, ebay_price: Decimal, amazon_price: Decimal) -> bool:
+    def validate_price_correlation(self, ebay_price: Union[Decimal, float], amazon_price: Union[Decimal, float]) -> bool:
         """Validate price correlation between eBay and Amazon.
         
         Args:
@@ -115,20 +237,58 @@ class MarketSanitizer(BaseSanitizer):
         Returns:
             True if prices are within acceptable range
         """
+        if not isinstance(ebay_price, (Decimal, numbers.Real)) or not isinstance(amazon_price, (Decimal, numbers.Real)):
+            logger.error("Price correlation validation failed: prices must be numeric")
+            return False
+        
+        # Compare in Decimal; floats go through str to keep their shortest repr
+        ebay_price = Decimal(str(ebay_price))
+        amazon_price = Decimal(str(amazon_price))
+        if not ebay_price.is_finite() or not amazon_price.is_finite():
+            logger.error("Price correlation validation failed: prices must be finite")
+            return False
+        
+        if amazon_price <= 0:
+            logger.warning("Amazon price must be positive")
+            return False
+        
+        # Check if within 30%, multiplying rather than dividing
+        if abs(ebay_price - amazon_price) > amazon_price * PRICE_CORRELATION_THRESHOLD:
+            logger.warning("Price difference too large")
+            return False
+        
+        return True
+    
+    def validate_price_correlation_batch(self, ebay_prices, amazon_prices) -> np.ndarray:
+        """Validate price correlation for many eBay/Amazon price pairs.
+        
+        Prices are compared as float64, which is precise enough for a
+        30% threshold.
+        
+        Args:
+            ebay_prices: eBay prices
+            amazon_prices: Amazon prices, aligned with ebay_prices
+            
+        Returns:
+            Boolean array, True where prices are within acceptable range
+        """
         try:
-            # Calculate price difference percentage
-            price_diff = abs(ebay_price - amazon_price) / amazon_price
+            ebay = np.asarray(ebay_prices, dtype=np.float64)
+            amazon = np.asarray(amazon_prices, dtype=np.float64)
             
-            # Check if within 30%
-            if price_diff > Decimal('0.30'):
-                logger.warning("Price difference too large")
-                return False
+            within = (amazon > 0) & (
+                np.abs(ebay - amazon) <= amazon * float(PRICE_CORRELATION_THRESHOLD)
+            )
             
-            return True
+            rejected = int(within.size - within.sum())
+            if rejected:
+                logger.warning(f"Price difference too large in {rejected} pairs")
+            
+            return within
             
         except Exception as e:
-            logger.error(f"Price correlation validation failed: {e}")
-            return False
+            logger.error(f"Batch price correlation validation failed: {e}")
+            return np.zeros(len(ebay_prices), dtype=bool)
     
     def validate_sales_rank(self, rank: int) -> bool:
         """Validate sales rank.
@@ -139,64 +299,110 @@ class MarketSanitizer(BaseSanitizer):
         Returns:
             True if valid
         """
-        try:
-            # Check if rank is reasonable
-            if rank > 1000000:
-                logger.warning("Sales rank too high")
-                return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Sales rank validation failed: {e}")
+        if not isinstance(rank, int):
+            logger.error("Sales rank validation failed: rank must be an integer")
+            return False
+        
+        # Check if rank is reasonable
+        if rank > 1000000:
+            logger.warning("Sales rank too high")
             return False
+        
+        return True
+    
+    @staticmethod
+    def _comparable_times(timestamp: datetime, now: datetime) -> bool:
+        """Check that a timestamp can be subtracted from the current time.
+        
+        Args:
+            timestamp: Timestamp to check
+            now: Current time
+            
+        Returns:
+            True if timestamp is a datetime with the same awareness as now
+        """
+        return (
+            isinstance(timestamp, datetime)
+            and (timestamp.tzinfo is None) == (now.tzinfo is None)
+        )
     
-    def validate_data_age(self, timestamp: datetime, max_age_days: int = 90) -> bool:
+    def validate_data_age(self, timestamp: datetime, max_age_days: int = 90,
+                          now: Optional[datetime] = None) -> bool:
         """Validate data age.
         
         Args:
             timestamp: Data timestamp
             max_age_days: Maximum age in days
+            now: Current time; defaults to the per-second cached time
             
         Returns:
             True if data is recent enough
         """
-        try:
-            # Calculate age
-            age = datetime.now() - timestamp
-            
-            # Check if within limit
-            if age > timedelta(days=max_age_days):
-                logger.warning(f"Data too old: {age.days} days")
-                return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Data age validation failed: {e}")
+        now = now or self._now()
+        if not self._comparable_times(timestamp, now):
+            logger.error("Data age validation failed: invalid timestamp")
             return False
+        
+        # Calculate age
+        age = now - timestamp
+        
+        # Check if within limit
+        if age > timedelta(days=max_age_days):
+            logger.warning(f"Data too old: {age.days} days")
+            return False
+        
+        return True
     
-    def validate_price_age(self, timestamp: datetime, max_age_hours: int = 24) -> bool:
+    def validate_price_age(self, timestamp: datetime, max_age_hours: int = 24,
+                           now: Optional[datetime] = None) -> bool:
         """Validate price age.
         
         Args:
             timestamp: Price timestamp
             max_age_hours: Maximum age in hours
+            now: Current time; defaults to the per-second cached time
             
         Returns:
             True if price is recent enough
         """
+        now = now or self._now()
+        if not self._comparable_times(timestamp, now):
+            logger.error("Price age validation failed: invalid timestamp")
+            return False
+        
+        # Calculate age
+        age = now - timestamp
+        
+        # Check if within limit
+        if age > timedelta(hours=max_age_hours):
+            logger.warning(f"Price too old: {age.total_seconds() / 3600:.1f} hours")
+            return False
+        
+        return True
+    
+    def validate_batch_ages(self, timestamps: List[datetime], max_age_days: int = 90,
+                            now: Optional[datetime] = None) -> List[bool]:
+        """Validate the age of many timestamps against one cutoff.
+        
+        Args:
+            timestamps: Data timestamps
+            max_age_days: Maximum age in days
+            now: Current time; defaults to the per-second cached time
+            
+        Returns:
+            Whether each timestamp is recent enough
+        """
         try:
-            # Calculate age
-            age = datetime.now() - timestamp
+            # Compare POSIX seconds against a single precomputed cutoff
+            cutoff = ((now or self._now()) - timedelta(days=max_age_days)).timestamp()
+            recent = [timestamp.timestamp() >= cutoff for timestamp in timestamps]
             
-            # Check if within limit
-            if age > timedelta(hours=max_age_hours):
-                logger.warning(f"Price too old: {age.total_seconds() / 3600:.1f} hours")
-                return False
+            stale = len(recent) - sum(recent)
+            if stale:
+                logger.warning(f"{stale} records older than {max_age_days} days")
             
-            return True
+            return recent
             
         except Exception as e:
-            logger.error(f"Price age validation failed: {e}")
-            return False 
\ No newline at end of file
+            logger.error(f"Batch data age validation failed: {e}")
+            return [False] * len(timestamps)
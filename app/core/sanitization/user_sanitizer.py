@@ -1,14 +1,41 @@
 from typing import Dict, List, Optional, Union
 import logging
+import numbers
+import re
 from decimal import Decimal
 
 from .base_sanitizer import BaseSanitizer
 
 logger = logging.getLogger(__name__)
 
+# Validation patterns, compiled once at import
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Deletes every ASCII non-digit, for stripping ASCII input without regex
+_NON_DIGIT_TRANS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+def _strip_non_digits(value: str) -> str:
+    """Remove non-digit characters.
+    
+    Args:
+        value: Text to strip
+        
+    Returns:
+        Digits of value, in order
+    """
+    if value.isascii():
+        return value.translate(_NON_DIGIT_TRANS)
+    return _NON_DIGIT_RE.sub('', value)
+
+# Optional contact fields, each sanitized with its own length limit
+OPTIONAL_TEXT_FIELDS = ('phone', 'address', 'city', 'state', 'zip')
+
 class UserSanitizer(BaseSanitizer):
     """Sanitizer for user input."""
     
+    __slots__ = ('valid_categories', '_valid_categories_set')
+    
     def __init__(self):
         """Initialize the user input sanitizer."""
         super().__init__()
@@ -38,15 +65,16 @@ class UserSanitizer(BaseSanitizer):
             'Toys',
             'Other'
         ]
+        self._valid_categories_set = frozenset(c.lower() for c in self.valid_categories)
     
-    def sanitize_user_input(self, user_input: Dict) -> Dict:
+    def sanitize_user_input(self, user_input: Dict) -> Optional[Dict]:
         """Sanitize user input.
         
         Args:
             user_input: User input to sanitize
             
         Returns:
-            Sanitized user input
+            Sanitized user input or None if invalid
         """
         try:
             sanitized = {}
@@ -56,27 +84,16 @@ class UserSanitizer(BaseSanitizer):
             for field in required_fields:
                 if field not in user_input:
                     logger.error(f"Missing required field: {field}")
-                    return {}
+                    return None
             
             # Sanitize basic fields
             sanitized['username'] = self.prevent_sql_injection(user_input['username'])
             sanitized['email'] = self.sanitize_text(user_input['email'], 'email')
             
             # Sanitize optional fields
-            if 'phone' in user_input:
-                sanitized['phone'] = self.sanitize_text(user_input['phone'], 'phone')
-            
-            if 'address' in user_input:
-                sanitized['address'] = self.sanitize_text(user_input['address'], 'address')
-            
-            if 'city' in user_input:
-                sanitized['city'] = self.sanitize_text(user_input['city'], 'city')
-            
-            if 'state' in user_input:
-                sanitized['state'] = self.sanitize_text(user_input['state'], 'state')
-            
-            if 'zip' in user_input:
-                sanitized['zip'] = self.sanitize_text(user_input['zip'], 'zip')
+            for field in OPTIONAL_TEXT_FIELDS:
+                if field in user_input:
+                    sanitized[field] = self.sanitize_text(user_input[field], field)
             
             # Sanitize preferences
             if 'preferences' in user_input:
@@ -87,7 +104,7 @@ class UserSanitizer(BaseSanitizer):
                 if 'categories' in preferences:
                     categories = []
                     for category in preferences['categories']:
-                        sanitized_category = self.sanitize_enum(category, self.valid_categories)
+                        sanitized_category = self.sanitize_enum_fast(category, self._valid_categories_set)
                         if sanitized_category:
                             categories.append(sanitized_category)
                     if categories:
@@ -121,7 +138,7 @@ class UserSanitizer(BaseSanitizer):
             
         except Exception as e:
             logger.error(f"User input sanitization failed: {e}")
-            return {}
+            return None
     
     def validate_price_range(self, min_price: Optional[Decimal], max_price: Optional[Decimal]) -> bool:
         """Validate price range.
@@ -133,21 +150,20 @@ class UserSanitizer(BaseSanitizer):
         Returns:
             True if valid
         """
-        try:
-            # Check if both prices are provided
-            if min_price is None or max_price is None:
-                return True
-            
-            # Check if min is less than max
-            if min_price > max_price:
-                logger.warning("Minimum price cannot be greater than maximum price")
-                return False
-            
+        # Check if both prices are provided
+        if min_price is None or max_price is None:
             return True
-            
-        except Exception as e:
-            logger.error(f"Price range validation failed: {e}")
+        
+        if not isinstance(min_price, (Decimal, numbers.Real)) or not isinstance(max_price, (Decimal, numbers.Real)):
+            logger.error("Price range validation failed: prices must be numeric")
+            return False
+        
+        # Check if min is less than max
+        if min_price > max_price:
+            logger.warning("Minimum price cannot be greater than maximum price")
             return False
+        
+        return True
     
     def validate_email(self, email: str) -> bool:
         """Validate email format.
@@ -158,17 +174,12 @@ class UserSanitizer(BaseSanitizer):
         Returns:
             True if valid
         """
-        try:
-            # Basic email format check
-            if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
-                logger.warning("Invalid email format")
-                return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Email validation failed: {e}")
+        # Basic email format check
+        if not isinstance(email, str) or not _EMAIL_RE.match(email):
+            logger.warning("Invalid email format")
             return False
+        
+        return True
     
     def validate_phone(self, phone: str) -> bool:
         """Validate phone number format.
@@ -179,20 +190,19 @@ class UserSanitizer(BaseSanitizer):
         Returns:
             True if valid
         """
-        try:
-            # Remove non-digits
-            digits = re.sub(r'\D', '', phone)
-            
-            # Check length
-            if len(digits) < 10 or len(digits) > 15:
-                logger.warning("Invalid phone number length")
-                return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Phone validation failed: {e}")
+        if not isinstance(phone, str):
+            logger.error("Phone validation failed: phone must be a string")
+            return False
+        
+        # Remove non-digits
+        digits = _strip_non_digits(phone)
+        
+        # Check length
+        if len(digits) < 10 or len(digits) > 15:
+            logger.warning("Invalid phone number length")
             return False
+        
+        return True
     
     def validate_zip(self, zip_code: str) -> bool:
         """Validate ZIP code format.
@@ -203,17 +213,16 @@ class UserSanitizer(BaseSanitizer):
         Returns:
             True if valid
         """
-        try:
-            # Remove non-digits
-            digits = re.sub(r'\D', '', zip_code)
-            
-            # Check length
-            if len(digits) != 5:
-                logger.warning("Invalid ZIP code length")
-                return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"ZIP code validation failed: {e}")
-            return False 
\ No newline at end of file
+        if not isinstance(zip_code, str):
+            logger.error("ZIP code validation failed: ZIP code must be a string")
+            return False
+        
+        # Remove non-digits
+        digits = _strip_non_digits(zip_code)
+        
+        # Check length
+        if len(digits) != 5:
+            logger.warning("Invalid ZIP code length")
+            return False
+        
+        return True 
\ No newline at end of file
@@ -1,25 +1,199 @@
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, Iterator, List, Optional, Union
 import logging
+import asyncio
+import copy
+import random
 import time
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlparse
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from cachetools import TTLCache
+from .scrapers.base_scraper import BaseScraper
 from .scrapers.scraper_factory import ScraperFactory
 from .proxy_manager import ProxyManager
 from .user_agent_manager import UserAgentManager
 
 logger = logging.getLogger(__name__)
 
+# Concurrent scrapes in a batch
+SCRAPE_WORKERS = 8
+
+# Scrapes submitted ahead of the consumer in a batch
+SCRAPE_WINDOW = SCRAPE_WORKERS * 2
+
+# Concurrent connections per host for async batches
+ASYNC_PER_HOST_LIMIT = 16
+
+# Upper bound on a single retry backoff in seconds
+MAX_RETRY_DELAY = 60
+
+# Recently scraped auctions reused across batches
+SCRAPE_CACHE_SIZE = 10000
+SCRAPE_CACHE_TTL = 300  # 5 minutes
+
 class ScraperService:
     """Service for managing auction scraping operations."""
     
+    __slots__ = (
+        'scraper_factory', 'proxy_manager', 'user_agent_manager', '_session',
+        '_host_next_request', '_host_lock'
+    )
+    
+    # Successful batch results keyed by (kind, scraper type, ID or URL),
+    # shared by every service in the process
+    _result_cache = TTLCache(maxsize=SCRAPE_CACHE_SIZE, ttl=SCRAPE_CACHE_TTL)
+    _cache_lock = threading.Lock()
+    
     def __init__(self):
         """Initialize the scraper service."""
         self.scraper_factory = ScraperFactory()
         self.proxy_manager = ProxyManager()
         self.user_agent_manager = UserAgentManager()
         
-        # Set managers in factory
+        # Keep-alive connections shared by all scrapers, one per batch worker
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=SCRAPE_WORKERS, pool_maxsize=SCRAPE_WORKERS)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
+        # Set managers and session in factory
         self.scraper_factory.set_proxy_manager(self.proxy_manager)
         self.scraper_factory.set_user_agent_manager(self.user_agent_manager)
+        self.scraper_factory.set_session(self._session)
+        
+        # Next allowed request time per host, for batch throttling
+        self._host_next_request: Dict[str, float] = {}
+        self._host_lock = threading.Lock()
+    
+    def _throttle(self, host: str, min_interval: float) -> None:
+        """Wait until a request to a host is allowed.
+        
+        Each caller reserves the next slot for the host under the lock and
+        sleeps outside it, so requests to one host stay min_interval apart
+        while other hosts proceed in parallel.
+        
+        Args:
+            host: Host being requested
+            min_interval: Minimum seconds between requests to the host
+        """
+        wait = self._reserve_slot(host, min_interval)
+        if wait > 0:
+            time.sleep(wait)
+    
+    def _reserve_slot(self, host: str, min_interval: float) -> float:
+        """Reserve the next request slot for a host.
+        
+        Args:
+            host: Host being requested
+            min_interval: Minimum seconds between requests to the host
+            
+        Returns:
+            Seconds to wait before the reserved slot
+        """
+        with self._host_lock:
+            now = time.monotonic()
+            slot = max(now, self._host_next_request.get(host, now))
+            self._host_next_request[host] = slot + min_interval
+        
+        return slot - now
+    
+    def _iter_scrape_batch(self, items: List[str], kind: str, scraper_type: str,
+                           scrape: Callable[[str], Dict]) -> Iterator[Dict]:
+        """Scrape a batch, fetching each distinct item at most once.
+        
+        Duplicates within the batch and items scraped successfully in the
+        last SCRAPE_CACHE_TTL seconds are served without a request. Results
+        are yielded in input order as soon as they are available, and a
+        result is only held while a later duplicate still needs it. At most
+        SCRAPE_WINDOW scrapes are queued or running at once, so a slow
+        consumer does not pile up finished results. Every yielded dict is
+        the caller's own; the cache keeps separate copies.
+        
+        Args:
+            items: Auction IDs or URLs to scrape
+            kind: Item kind, part of the cache key
+            scraper_type: Type of scraper used, part of the cache key
+            scrape: Function scraping a single item
+            
+        Yields:
+            Result dictionaries in input order
+        """
+        remaining = Counter(items)
+        held: Dict[str, Dict] = {}
+        pending = []
+        with self._cache_lock:
+            for item in remaining:
+                cached = self._result_cache.get((kind, scraper_type, item))
+                if cached is not None:
+                    held[item] = copy.deepcopy(cached)
+                else:
+                    pending.append(item)
+        
+        executor = ThreadPoolExecutor(max_workers=SCRAPE_WORKERS)
+        # Pending items are in first-occurrence order, as they are consumed below
+        to_submit = iter(pending)
+        in_flight = deque()
+        
+        def refill() -> None:
+            while len(in_flight) < SCRAPE_WINDOW:
+                item = next(to_submit, None)
+                if item is None:
+                    return
+                in_flight.append(executor.submit(scrape, item))
+        
+        try:
+            refill()
+            for item in items:
+                if item not in held:
+                    result = in_flight.popleft().result()
+                    refill()
+                    if "error" not in result:
+                        with self._cache_lock:
+                            self._result_cache[(kind, scraper_type, item)] = copy.deepcopy(result)
+                    held[item] = result
+                
+                # Earlier duplicates get copies; the last one takes the held dict
+                remaining[item] -= 1
+                result = held.pop(item) if not remaining[item] else copy.deepcopy(held[item])
+                yield result
+        finally:
+            # Drop queued scrapes if the caller stops early
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def clear_cache(self) -> None:
+        """Clear cached batch results."""
+        with self._cache_lock:
+            self._result_cache.clear()
+    
+    def _sleep_backoff(self, attempt: int, base: float, cap: float = MAX_RETRY_DELAY) -> None:
+        """Sleep before a retry with exponential backoff and jitter.
+        
+        Args:
+            attempt: Zero-based attempt that just failed
+            base: Delay after the first failure in seconds
+            cap: Maximum delay before jitter in seconds
+        """
+        time.sleep(self._backoff_delay(attempt, base, cap))
+    
+    def _backoff_delay(self, attempt: int, base: float, cap: float = MAX_RETRY_DELAY) -> float:
+        """Compute a retry delay with exponential backoff and jitter.
+        
+        Args:
+            attempt: Zero-based attempt that just failed
+            base: Delay after the first failure in seconds
+            cap: Maximum delay before jitter in seconds
+            
+        Returns:
+            Delay in seconds
+        """
+        delay = min(cap, base * (2 ** attempt)) * random.uniform(0.5, 1.5)
+        logger.info(f"Retrying in {delay:.1f} seconds...")
+        return delay
     
     def scrape_auction(self, 
                       auction_id: str, 
@@ -32,7 +206,7 @@ class ScraperService:
             auction_id: Auction ID to scrape
             scraper_type: Type of scraper to use
             max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
+            retry_delay: Base delay between retries in seconds
             
         Returns:
             Dictionary containing auction data
@@ -40,19 +214,48 @@ class ScraperService:
         Raises:
             ValueError: If scraping fails after max retries
         """
-        scraper = self.scraper_factory.get_scraper(scraper_type)
+        return self._scrape_auction_with(
+            self.scraper_factory.get_scraper(scraper_type),
+            auction_id,
+            max_retries,
+            retry_delay
+        )
+    
+    def _scrape_auction_with(self,
+                             scraper: BaseScraper,
+                             auction_id: str,
+                             max_retries: int,
+                             retry_delay: int) -> Dict:
+        """Scrape an auction by ID with an already resolved scraper.
         
+        Args:
+            scraper: Scraper instance to use
+            auction_id: Auction ID to scrape
+            max_retries: Maximum number of retry attempts
+            retry_delay: Base delay between retries in seconds
+            
+        Returns:
+            Dictionary containing auction data
+            
+        Raises:
+            ValueError: If scraping fails after max retries
+        """
         for attempt in range(max_retries):
+            # Breaker state lives on the scraper's own proxy manager, which the
+            # factory may have shared from an earlier service
+            proxy = scraper.proxy_manager.get_proxy()
             try:
-                return scraper.scrape_by_id(auction_id)
+                result = scraper.scrape_by_id(auction_id)
+                scraper.proxy_manager.record_success(proxy)
+                return result
             except Exception as e:
                 logger.error(f"Scraping attempt {attempt + 1} failed: {e}")
+                scraper.proxy_manager.record_failure(proxy)
                 if attempt < max_retries - 1:
-                    logger.info(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+                    self._sleep_backoff(attempt, retry_delay)
                     # Rotate proxy and user agent on retry
-                    self.proxy_manager.rotate_proxy()
-                    self.user_agent_manager.rotate_user_agent()
+                    scraper.proxy_manager.rotate_proxy()
+                    scraper.user_agent_manager.rotate_user_agent()
                 else:
                     raise ValueError(f"Failed to scrape auction {auction_id} after {max_retries} attempts")
     
@@ -68,35 +271,62 @@ class ScraperService:
             auction_ids: List of auction IDs to scrape
             scraper_type: Type of scraper to use
             max_retries: Maximum number of retry attempts per auction
-            retry_delay: Delay between retries in seconds
-            delay_between: Delay between scraping different auctions in seconds
+            retry_delay: Base delay between retries in seconds
+            delay_between: Minimum delay between requests to the same host in seconds
             
         Returns:
-            List of dictionaries containing auction data
+            List of dictionaries containing auction data, in input order
+        """
+        return list(self.iter_scrape_auctions(
+            auction_ids,
+            scraper_type,
+            max_retries,
+            retry_delay,
+            delay_between
+        ))
+    
+    def iter_scrape_auctions(self,
+                             auction_ids: List[str],
+                             scraper_type: str = "ebay",
+                             max_retries: int = 3,
+                             retry_delay: int = 5,
+                             delay_between: int = 2) -> Iterator[Dict]:
+        """Scrape multiple auctions, yielding results as they are ready.
+        
+        Args:
+            auction_ids: List of auction IDs to scrape
+            scraper_type: Type of scraper to use
+            max_retries: Maximum number of retry attempts per auction
+            retry_delay: Base delay between retries in seconds
+            delay_between: Minimum delay between requests to the same host in seconds
+            
+        Yields:
+            Dictionaries containing auction data, in input order
         """
-        results = []
         scraper = self.scraper_factory.get_scraper(scraper_type)
         
-        for auction_id in auction_ids:
+        # Failures in a batch share the batch start time
+        started_at = datetime.utcnow().isoformat()
+        
+        def scrape(auction_id: str) -> Dict:
+            # All auction IDs of a scraper type hit the same site
+            self._throttle(scraper_type, delay_between)
             try:
-                result = self.scrape_auction(
+                return self._scrape_auction_with(
+                    scraper,
                     auction_id,
-                    scraper_type,
                     max_retries,
                     retry_delay
                 )
-                results.append(result)
-                # Add delay between auctions
-                time.sleep(delay_between)
             except Exception as e:
                 logger.error(f"Failed to scrape auction {auction_id}: {e}")
-                results.append({
+                return {
                     "auction_id": auction_id,
                     "error": str(e),
-                    "scraped_at": datetime.utcnow().isoformat()
-                })
+                    "scraped_at": started_at
+                }
         
-        return results
+        yield from self._iter_scrape_batch(auction_ids, "id", scraper_type, scrape)
     
     def scrape_by_url(self,
                      url: str,
@@ -109,7 +339,7 @@ class ScraperService:
             url: Auction URL to scrape
             scraper_type: Type of scraper to use
             max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
+            retry_delay: Base delay between retries in seconds
             
         Returns:
             Dictionary containing auction data
@@ -117,19 +347,47 @@ class ScraperService:
         Raises:
             ValueError: If scraping fails after max retries
         """
-        scraper = self.scraper_factory.get_scraper(scraper_type)
+        return self._scrape_url_with(
+            self.scraper_factory.get_scraper(scraper_type),
+            url,
+            max_retries,
+            retry_delay
+        )
+    
+    def _scrape_url_with(self,
+                         scraper: BaseScraper,
+                         url: str,
+                         max_retries: int,
+                         retry_delay: int) -> Dict:
+        """Scrape an auction by URL with an already resolved scraper.
         
+        Args:
+            scraper: Scraper instance to use
+            url: Auction URL to scrape
+            max_retries: Maximum number of retry attempts
+            retry_delay: Base delay between retries in seconds
+            
+        Returns:
+            Dictionary containing auction data
+            
+        Raises:
+            ValueError: If scraping fails after max retries
+        """
         for attempt in range(max_retries):
+            # Breaker state is charged to the proxy this attempt goes through
+            proxy = scraper.proxy_manager.get_proxy()
             try:
-                return scraper.scrape_by_url(url)
+                result = scraper.scrape_by_url(url)
+                scraper.proxy_manager.record_success(proxy)
+                return result
             except Exception as e:
                 logger.error(f"Scraping attempt {attempt + 1} failed: {e}")
+                scraper.proxy_manager.record_failure(proxy)
                 if attempt < max_retries - 1:
-                    logger.info(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+                    self._sleep_backoff(attempt, retry_delay)
                     # Rotate proxy and user agent on retry
-                    self.proxy_manager.rotate_proxy()
-                    self.user_agent_manager.rotate_user_agent()
+                    scraper.proxy_manager.rotate_proxy()
+                    scraper.user_agent_manager.rotate_user_agent()
                 else:
                     raise ValueError(f"Failed to scrape URL {url} after {max_retries} attempts")
     
@@ -145,35 +403,138 @@ class ScraperService:
             urls: List of auction URLs to scrape
             scraper_type: Type of scraper to use
             max_retries: Maximum number of retry attempts per auction
-            retry_delay: Delay between retries in seconds
-            delay_between: Delay between scraping different auctions in seconds
+            retry_delay: Base delay between retries in seconds
+            delay_between: Minimum delay between requests to the same host in seconds
             
         Returns:
-            List of dictionaries containing auction data
+            List of dictionaries containing auction data, in input order
+        """
+        return list(self.iter_scrape_by_urls(
+            urls,
+            scraper_type,
+            max_retries,
+            retry_delay,
+            delay_between
+        ))
+    
+    def iter_scrape_by_urls(self,
+                            urls: List[str],
+                            scraper_type: str = "ebay",
+                            max_retries: int = 3,
+                            retry_delay: int = 5,
+                            delay_between: int = 2) -> Iterator[Dict]:
+        """Scrape multiple auctions by URL, yielding results as they are ready.
+        
+        Args:
+            urls: List of auction URLs to scrape
+            scraper_type: Type of scraper to use
+            max_retries: Maximum number of retry attempts per auction
+            retry_delay: Base delay between retries in seconds
+            delay_between: Minimum delay between requests to the same host in seconds
+            
+        Yields:
+            Dictionaries containing auction data, in input order
         """
-        results = []
         scraper = self.scraper_factory.get_scraper(scraper_type)
         
-        for url in urls:
+        # Failures in a batch share the batch start time
+        started_at = datetime.utcnow().isoformat()
+        
+        def scrape(url: str) -> Dict:
+            self._throttle(urlparse(url).netloc, delay_between)
             try:
-                result = self.scrape_by_url(
+                return self._scrape_url_with(
+                    scraper,
                     url,
-                    scraper_type,
                     max_retries,
                     retry_delay
                 )
-                results.append(result)
-                # Add delay between auctions
-                time.sleep(delay_between)
             except Exception as e:
                 logger.error(f"Failed to scrape URL {url}: {e}")
-                results.append({
+                return {
                     "url": url,
                     "error": str(e),
-                    "scraped_at": datetime.utcnow().isoformat()
-                })
+                    "scraped_at": started_at
+                }
+        
+        yield from self._iter_scrape_batch(urls, "url", scraper_type, scrape)
+    
+    async def scrape_by_urls_async(self,
+                                   urls: List[str],
+                                   scraper_type: str = "ebay",
+                                   max_retries: int = 3,
+                                   retry_delay: int = 5,
+                                   delay_between: int = 2,
+                                   concurrency: int = SCRAPE_WORKERS) -> List[Dict]:
+        """Scrape multiple auctions by URL from an event loop.
+        
+        Each distinct URL is scraped once through the scraper's
+        scrape_by_url_async, sharing one aiohttp session with at most
+        concurrency scrapes in flight.
+        Successful results share the cache used by scrape_by_urls, and
+        cached results are returned as copies.
+        
+        Args:
+            urls: List of auction URLs to scrape
+            scraper_type: Type of scraper to use
+            max_retries: Maximum number of retry attempts per auction
+            retry_delay: Base delay between retries in seconds
+            delay_between: Minimum delay between requests to the same host in seconds
+            concurrency: Maximum number of scrapes in flight
+            
+        Returns:
+            List of dictionaries containing auction data, in input order
+        """
+        scraper = self.scraper_factory.get_scraper(scraper_type)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        # Failures in a batch share the batch start time
+        started_at = datetime.utcnow().isoformat()
+        
+        async def scrape(url: str) -> Dict:
+            key = ("url", scraper_type, url)
+            with self._cache_lock:
+                cached = self._result_cache.get(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+            
+            async with semaphore:
+                wait = self._reserve_slot(urlparse(url).netloc, delay_between)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                
+                for attempt in range(max_retries):
+                    # Breaker state is charged to the proxy this attempt goes through
+                    proxy = scraper.proxy_manager.get_proxy()
+                    try:
+                        result = await scraper.scrape_by_url_async(url, session)
+                        scraper.proxy_manager.record_success(proxy)
+                        with self._cache_lock:
+                            self._result_cache[key] = copy.deepcopy(result)
+                        return result
+                    except Exception as e:
+                        logger.error(f"Scraping attempt {attempt + 1} failed: {e}")
+                        scraper.proxy_manager.record_failure(proxy)
+                        if attempt < max_retries - 1:
+                            await asyncio.sleep(self._backoff_delay(attempt, retry_delay))
+                            # Rotate proxy and user agent on retry
+                            scraper.proxy_manager.rotate_proxy()
+                            scraper.user_agent_manager.rotate_user_agent()
+            
+            logger.error(f"Failed to scrape URL {url}")
+            return {
+                "url": url,
+                "error": f"Failed to scrape URL {url} after {max_retries} attempts",
+                "scraped_at": started_at
+            }
+        
+        unique_urls = list(dict.fromkeys(urls))
+        connector = aiohttp.TCPConnector(limit_per_host=ASYNC_PER_HOST_LIMIT, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            fetched = await asyncio.gather(*(scrape(url) for url in unique_urls))
         
-        return results
+        results = dict(zip(unique_urls, fetched))
+        return [results[url] for url in urls]
     
     def get_scraper_stats(self) -> Dict:
         """Get statistics about the scrapers.
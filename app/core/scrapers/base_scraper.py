@@ -1,34 +1,96 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Union
 import logging
+import asyncio
+import aiohttp
 from datetime import datetime
 import re
 import time
 import random
 from pathlib import Path
-import json
+from functools import lru_cache
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 
 from src.services.proxy_manager import ProxyManager
 from src.services.user_agent_manager import UserAgentManager
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections pooled per host by a scraper's own session
+SESSION_POOL_SIZE = 32
+
+# Extraction patterns, compiled once at import
+_BID_RE = re.compile(r'\$(\d+\.\d{2})')
+
+# CAPTCHA page markers, matched in raw bytes or decoded text
+_CAPTCHA_RE = re.compile(r'captcha|robot', re.IGNORECASE)
+_CAPTCHA_BYTES_RE = re.compile(rb'captcha|robot', re.IGNORECASE)
+
+# Labelled description fields, found in one scan. The value is captured in a
+# lookahead so labels inside another field's value are still matched.
+_DESC_FIELDS_RE = re.compile(
+    r'(?P<field>Brand|Model|UPC|ASIN|Condition|Damage Notes):(?=\s*(?P<value>[^\n]+))'
+)
+
+# Formats for description fields narrower than the rest of the line
+_DESC_VALUE_RES = {
+    'UPC': re.compile(r'\d+'),
+    'ASIN': re.compile(r'[A-Z0-9]{10}')
+}
+
+@lru_cache(maxsize=1)
+def _utc_iso_for_second(second: int) -> str:
+    """Get the current UTC time in ISO format, computed once per second.
+    
+    Args:
+        second: Monotonic clock second, used as the cache key
+        
+    Returns:
+        Current UTC time as an ISO 8601 string
+    """
+    return datetime.utcnow().isoformat()
+
+@lru_cache(maxsize=None)
+def _load_config_cached(name: str) -> Dict:
+    """Load a scraper's configuration file once per process.
+    
+    Call _load_config_cached.cache_clear() to pick up edited configs.
+    
+    Args:
+        name: Scraper name
+        
+    Returns:
+        Dictionary containing configuration
+    """
+    config_path = Path(__file__).parent / "config" / f"{name}_config.json"
+    if config_path.exists():
+        return orjson.loads(config_path.read_bytes())
+    return {}
+
 class BaseScraper(ABC):
     """Base class for auction scrapers."""
     
-    def __init__(self, proxy_manager: Optional[ProxyManager] = None, user_agent_manager: Optional[UserAgentManager] = None):
+    def __init__(self, proxy_manager: Optional[ProxyManager] = None, user_agent_manager: Optional[UserAgentManager] = None,
+                 session: Optional[requests.Session] = None):
         """Initialize the scraper.
         
         Args:
             proxy_manager: Optional proxy manager for rotating proxies
             user_agent_manager: Optional user agent manager for rotating user agents
+            session: Optional HTTP session whose connection pool is shared with other scrapers
         """
         self.proxy_manager = proxy_manager or ProxyManager()
         self.user_agent_manager = user_agent_manager or UserAgentManager()
+        self.session = session or self._create_session()
         self.name = self.__class__.__name__.lower().replace("scraper", "")
         
         # Load configuration
         self.config = self._load_config()
+        
+        # Description fields of the last element parsed, as (element, fields)
+        self._desc_cache = (None, {})
     
     @abstractmethod
     def scrape_auction(self, auction_id: str, auction_name: Optional[str] = None) -> Dict:
@@ -55,17 +117,78 @@ class BaseScraper(ABC):
         """
         pass
     
+    async def scrape_by_url_async(self, url: str, session: Optional[aiohttp.ClientSession] = None) -> Dict:
+        """Scrape an auction by URL without blocking the event loop.
+        
+        Runs the blocking scrape_by_url in the loop's default executor.
+        Scrapers with a native async client can override this.
+        
+        Args:
+            url: The auction URL to scrape
+            session: Optional aiohttp session for scrapers that fetch natively
+            
+        Returns:
+            Dictionary containing auction data
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.scrape_by_url, url)
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a keep-alive session for a scraper without a shared one.
+        
+        Returns:
+            HTTP session with pooled connections
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=SESSION_POOL_SIZE, pool_maxsize=SESSION_POOL_SIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
     def _load_config(self) -> Dict:
         """Load scraper configuration from file.
         
         Returns:
             Dictionary containing configuration
         """
-        config_path = Path(__file__).parent / "config" / f"{self.name}_config.json"
-        if config_path.exists():
-            with open(config_path, "r") as f:
-                return json.load(f)
-        return {}
+        # Copy so instances cannot alter the shared cached config
+        return dict(_load_config_cached(self.name))
+    
+    def _extract_description_fields(self, element) -> Dict[str, str]:
+        """Extract all labelled fields from an element's description.
+        
+        The description is read and scanned once per element; repeated
+        calls for the same element reuse the result.
+        
+        Args:
+            element: HTML element containing the description
+            
+        Returns:
+            Dictionary of field label to the first valid value
+        """
+        cached_element, cached_fields = self._desc_cache
+        if cached_element is element:
+            return cached_fields
+        
+        fields = {}
+        description = element.css(".lot-description::text").get()
+        if description:
+            for match in _DESC_FIELDS_RE.finditer(description):
+                field = match.group("field")
+                if field in fields:
+                    continue
+                value = match.group("value")
+                value_re = _DESC_VALUE_RES.get(field)
+                if value_re:
+                    value_match = value_re.match(value)
+                    if not value_match:
+                        continue
+                    value = value_match.group(0)
+                fields[field] = value.strip()
+        
+        self._desc_cache = (element, fields)
+        return fields
     
     def _extract_lot_number(self, element) -> str:
         """Extract lot number from element.
@@ -108,7 +231,7 @@ class BaseScraper(ABC):
         """
         # Default implementation using regex
         bid_text = element.get()
-        match = re.search(r'\$(\d+\.\d{2})', bid_text)
+        match = _BID_RE.search(bid_text)
         if match:
             return float(match.group(1))
         return 0.0
@@ -123,11 +246,9 @@ class BaseScraper(ABC):
             Extracted brand
         """
         # Method A: From description
-        description = element.css(".lot-description::text").get()
-        if description:
-            match = re.search(r'Brand:\s*([^\n]+)', description)
-            if match:
-                return match.group(1).strip()
+        brand = self._extract_description_fields(element).get("Brand")
+        if brand is not None:
+            return brand
         
         # Method B: NLP extraction from title (placeholder)
         title = self._extract_title(element)
@@ -153,11 +274,9 @@ class BaseScraper(ABC):
             Extracted model
         """
         # Method A: From description
-        description = element.css(".lot-description::text").get()
-        if description:
-            match = re.search(r'Model:\s*([^\n]+)', description)
-            if match:
-                return match.group(1).strip()
+        model = self._extract_description_fields(element).get("Model")
+        if model is not None:
+            return model
         
         # Method B: NLP extraction from title (placeholder)
         title = self._extract_title(element)
@@ -189,12 +308,7 @@ class BaseScraper(ABC):
             Extracted UPC
         """
         # Default implementation
-        description = element.css(".lot-description::text").get()
-        if description:
-            match = re.search(r'UPC:\s*(\d+)', description)
-            if match:
-                return match.group(1).strip()
-        return ""
+        return self._extract_description_fields(element).get("UPC", "")
     
     def _extract_asin(self, element) -> str:
         """Extract ASIN from element.
@@ -206,12 +320,7 @@ class BaseScraper(ABC):
             Extracted ASIN
         """
         # Default implementation
-        description = element.css(".lot-description::text").get()
-        if description:
-            match = re.search(r'ASIN:\s*([A-Z0-9]{10})', description)
-            if match:
-                return match.group(1).strip()
-        return ""
+        return self._extract_description_fields(element).get("ASIN", "")
     
     def _extract_condition(self, element) -> str:
         """Extract condition from element.
@@ -223,12 +332,7 @@ class BaseScraper(ABC):
             Extracted condition
         """
         # Default implementation
-        description = element.css(".lot-description::text").get()
-        if description:
-            match = re.search(r'Condition:\s*([^\n]+)', description)
-            if match:
-                return match.group(1).strip()
-        return ""
+        return self._extract_description_fields(element).get("Condition", "")
     
     def _extract_damage_notes(self, element) -> List[str]:
         """Extract damage notes from element.
@@ -240,24 +344,24 @@ class BaseScraper(ABC):
             List of extracted damage notes
         """
         # Default implementation
-        description = element.css(".lot-description::text").get()
-        if description:
-            match = re.search(r'Damage Notes:\s*([^\n]+)', description)
-            if match:
-                return [note.strip() for note in match.group(1).split(",")]
+        notes = self._extract_description_fields(element).get("Damage Notes")
+        if notes is not None:
+            return [note.strip() for note in notes.split(",")]
         return []
     
     def _handle_captcha(self, response) -> bool:
         """Handle CAPTCHA detection.
         
         Args:
-            response: HTTP response
+            response: HTTP response, or page text already read from one
             
         Returns:
             True if CAPTCHA was handled, False otherwise
         """
-        # Check for CAPTCHA indicators
-        if "captcha" in response.text.lower() or "robot" in response.text.lower():
+        # Check for CAPTCHA indicators without decoding or lowercasing the page
+        content = response if isinstance(response, (str, bytes)) else response.content
+        pattern = _CAPTCHA_BYTES_RE if isinstance(content, bytes) else _CAPTCHA_RE
+        if pattern.search(content):
             logger.warning("CAPTCHA detected, rotating proxy")
             self.proxy_manager.rotate_proxy()
             return True
@@ -296,11 +400,38 @@ class BaseScraper(ABC):
             "auction_meta": {
                 "id": auction_id,
                 "name": auction_name,
-                "end_time": datetime.utcnow().isoformat(),  # TODO: Extract actual end time
+                "end_time": self._utcnow_iso(),  # TODO: Extract actual end time
             },
             "items": items
         }
     
+    def _utcnow_iso(self) -> str:
+        """Get the current UTC time at one-second granularity.
+        
+        Returns:
+            ISO 8601 timestamp, shared by calls within the same second
+        """
+        return _utc_iso_for_second(time.monotonic_ns() // 1_000_000_000)
+    
+    def _format_output_bytes(self, auction_id: str, auction_name: str, items: List[Dict]) -> bytes:
+        """Format scraped data into serialized JSON output.
+        
+        For pipelines that forward results to a queue or cache without
+        re-encoding them.
+        
+        Args:
+            auction_id: The auction ID
+            auction_name: The auction name
+            items: List of scraped items
+            
+        Returns:
+            UTF-8 encoded JSON of the formatted output
+        """
+        return orjson.dumps(
+            self._format_output(auction_id, auction_name, items),
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+        )
+    
     def _delay(self, seconds: float) -> None:
         """Apply delay between requests.
         
@@ -1,8 +1,11 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 import logging
+import asyncio
+import aiohttp
 import requests
 from bs4 import BeautifulSoup
 import re
+import time
 from datetime import datetime
 from .base_scraper import BaseScraper
 from ..proxy_manager import ProxyManager
@@ -10,19 +13,45 @@ from ..user_agent_manager import UserAgentManager
 
 logger = logging.getLogger(__name__)
 
+# Extraction patterns, compiled once at import
+_ITM_URL_RE = re.compile(r"/itm/(\d+)")
+_NON_PRICE_RE = re.compile(r'[^\d.]')
+
+# Page request timeout in seconds
+REQUEST_TIMEOUT = 30
+
+# Attempts per page while CAPTCHAs are served, unless set in the scraper config
+CAPTCHA_RETRIES = 3
+
+def _parse_amount(text: str) -> float:
+    """Parse a currency amount, ignoring symbols and separators.
+    
+    Args:
+        text: Amount text such as "US $1,234.56"
+        
+    Returns:
+        Amount as float
+    """
+    return float(_NON_PRICE_RE.sub('', text))
+
 class EbayScraper(BaseScraper):
     """eBay auction scraper implementation."""
     
     def __init__(self, proxy_manager: Optional[ProxyManager] = None, 
-                 user_agent_manager: Optional[UserAgentManager] = None):
+                 user_agent_manager: Optional[UserAgentManager] = None,
+                 session: Optional[requests.Session] = None):
         """Initialize the eBay scraper.
         
         Args:
             proxy_manager: Optional proxy manager instance
             user_agent_manager: Optional user agent manager instance
+            session: Optional shared HTTP session
         """
-        super().__init__(proxy_manager, user_agent_manager)
+        super().__init__(proxy_manager, user_agent_manager, session)
         self.base_url = "https://www.ebay.com"
+        
+        # Item attribute elements of the last page parsed, as (soup, attributes)
+        self._attr_cache = (None, {})
     
     def scrape_by_id(self, auction_id: str) -> Dict:
         """Scrape an eBay auction by ID.
@@ -45,72 +74,189 @@ class EbayScraper(BaseScraper):
         Returns:
             Dictionary containing auction data
         """
-        # Get proxy and user agent
-        proxy = self.proxy_manager.get_proxy() if self.proxy_manager else None
-        user_agent = self.user_agent_manager.get_user_agent() if self.user_agent_manager else None
-        
-        # Set up headers
-        headers = {
-            "User-Agent": user_agent or "Mozilla/5.0",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Connection": "keep-alive",
-        }
+        max_retries = self.config.get("max_retries", CAPTCHA_RETRIES)
         
         try:
-            # Make request
-            response = requests.get(
-                url,
-                headers=headers,
-                proxies=proxy,
-                timeout=30
-            )
-            response.raise_for_status()
-            
-            # Check for CAPTCHA
-            if self._handle_captcha(response.text):
-                logger.warning("CAPTCHA detected, rotating proxy and user agent")
-                if self.proxy_manager:
-                    self.proxy_manager.rotate_proxy()
-                if self.user_agent_manager:
-                    self.user_agent_manager.rotate_user_agent()
-                return self.scrape_by_url(url)
+            for attempt in range(max_retries):
+                # Get proxy and headers
+                proxy = self.proxy_manager.get_proxy() if self.proxy_manager else None
+                
+                # Make request
+                response = self.session.get(
+                    url,
+                    headers=self._request_headers(),
+                    proxies=proxy,
+                    timeout=REQUEST_TIMEOUT
+                )
+                response.raise_for_status()
+                
+                # Check for CAPTCHA before parsing anything
+                if not self._handle_captcha(response):
+                    return self._parse_page(url, response.text)
+                
+                self._rotate_user_agent()
+                if attempt < max_retries - 1:
+                    time.sleep(self._captcha_backoff(attempt))
             
-            # Parse HTML
-            soup = BeautifulSoup(response.text, "html.parser")
+            raise ValueError(f"CAPTCHA served for {url} after {max_retries} attempts")
             
-            # Extract data
-            data = {
-                "auction_id": self._extract_lot_number(soup),
-                "title": self._extract_title(soup),
-                "current_bid": self._extract_current_bid(soup),
-                "brand": self._extract_brand(soup),
-                "model": self._extract_model(soup),
-                "upc": self._extract_upc(soup),
-                "asin": self._extract_asin(soup),
-                "condition": self._extract_condition(soup),
-                "damage_notes": self._extract_damage_notes(soup),
-                "end_time": self._extract_end_time(soup),
-                "seller": self._extract_seller(soup),
-                "shipping": self._extract_shipping(soup),
-                "returns": self._extract_returns(soup),
-                "url": url,
-                "scraped_at": datetime.utcnow().isoformat()
-            }
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request failed: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Scraping failed: {e}")
+            raise
+    
+    async def scrape_by_url_async(self, url: str, session: Optional[aiohttp.ClientSession] = None) -> Dict:
+        """Scrape an eBay auction by URL on the event loop.
+        
+        The page is fetched with aiohttp and parsed in the loop's default
+        executor. Without a session, or when the current proxy is not an
+        HTTP proxy (aiohttp cannot use the SOCKS proxies), the blocking
+        scrape runs in the executor instead.
+        
+        Args:
+            url: eBay auction URL
+            session: Optional aiohttp session to fetch with
             
-            # Validate data
-            if not self._validate_data(data):
-                raise ValueError("Required fields missing from scraped data")
+        Returns:
+            Dictionary containing auction data
+        """
+        if session is None:
+            return await super().scrape_by_url_async(url, session)
+        
+        max_retries = self.config.get("max_retries", CAPTCHA_RETRIES)
+        
+        try:
+            for attempt in range(max_retries):
+                proxy = self.proxy_manager.get_proxy() if self.proxy_manager else None
+                proxy_url = proxy.get("http") if proxy else None
+                if proxy_url and not proxy_url.startswith("http"):
+                    return await super().scrape_by_url_async(url, session)
+                
+                # Make request
+                async with session.get(
+                    url,
+                    headers=self._request_headers(),
+                    proxy=proxy_url,
+                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+                ) as response:
+                    response.raise_for_status()
+                    content = await response.read()
+                
+                # Check for CAPTCHA before parsing anything
+                if not self._handle_captcha(content):
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(None, self._parse_page, url, content)
+                
+                self._rotate_user_agent()
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(self._captcha_backoff(attempt))
             
-            return self._format_output(data)
+            raise ValueError(f"CAPTCHA served for {url} after {max_retries} attempts")
             
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             logger.error(f"Request failed: {e}")
             raise
         except Exception as e:
             logger.error(f"Scraping failed: {e}")
             raise
     
+    def _request_headers(self) -> Dict[str, str]:
+        """Build request headers with the current user agent.
+        
+        Returns:
+            Dictionary of HTTP headers
+        """
+        user_agent = self.user_agent_manager.get_user_agent() if self.user_agent_manager else None
+        
+        return {
+            "User-Agent": user_agent or "Mozilla/5.0",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+            "Connection": "keep-alive",
+        }
+    
+    def _captcha_backoff(self, attempt: int) -> float:
+        """Get the wait before retrying a page that served a CAPTCHA.
+        
+        Args:
+            attempt: Zero-based attempt that was served a CAPTCHA
+            
+        Returns:
+            Delay in seconds
+        """
+        return 2 ** attempt * self._get_random_delay()
+    
+    def _rotate_user_agent(self) -> None:
+        """Rotate the user agent after a CAPTCHA.
+        
+        _handle_captcha has already rotated the proxy.
+        """
+        if self.user_agent_manager:
+            self.user_agent_manager.rotate_user_agent()
+    
+    def _parse_page(self, url: str, html: Union[str, bytes]) -> Dict:
+        """Parse an eBay item page.
+        
+        Args:
+            url: eBay auction URL
+            html: Page HTML, as text or raw bytes
+            
+        Returns:
+            Dictionary containing auction data
+        """
+        # Parse HTML
+        soup = BeautifulSoup(html, "lxml")
+        
+        # Extract data
+        data = {
+            "auction_id": self._extract_lot_number(soup),
+            "title": self._extract_title(soup),
+            "current_bid": self._extract_current_bid(soup),
+            "brand": self._extract_brand(soup),
+            "model": self._extract_model(soup),
+            "upc": self._extract_upc(soup),
+            "asin": self._extract_asin(soup),
+            "condition": self._extract_condition(soup),
+            "damage_notes": self._extract_damage_notes(soup),
+            "end_time": self._extract_end_time(soup),
+            "seller": self._extract_seller(soup),
+            "shipping": self._extract_shipping(soup),
+            "returns": self._extract_returns(soup),
+            "url": url,
+            "scraped_at": self._utcnow_iso()
+        }
+        
+        # Validate data
+        if not self._validate_data(data):
+            raise ValueError("Required fields missing from scraped data")
+        
+        return self._format_output(data)
+    
+    def _item_attributes(self, soup: BeautifulSoup) -> Dict:
+        """Index the item attribute elements of an eBay page.
+        
+        The page is walked once per soup; repeated calls for the same
+        soup reuse the result.
+        
+        Args:
+            soup: BeautifulSoup object
+            
+        Returns:
+            Dictionary of attribute name to its first attribute element
+        """
+        cached_soup, cached_attributes = self._attr_cache
+        if cached_soup is soup:
+            return cached_attributes
+        
+        attributes = {}
+        for elem in soup.find_all("div", {"class": "it-attr"}):
+            attributes.setdefault(elem.get("data-name"), elem)
+        
+        self._attr_cache = (soup, attributes)
+        return attributes
+    
     def _extract_lot_number(self, soup: BeautifulSoup) -> str:
         """Extract auction ID from eBay page.
         
@@ -123,7 +269,7 @@ class EbayScraper(BaseScraper):
         # Try to find in URL first
         url = soup.find("meta", property="og:url")
         if url:
-            match = re.search(r"/itm/(\d+)", url.get("content", ""))
+            match = _ITM_URL_RE.search(url.get("content", ""))
             if match:
                 return match.group(1)
         
@@ -162,7 +308,7 @@ class EbayScraper(BaseScraper):
         if bid_elem:
             bid_text = bid_elem.text.strip()
             # Remove currency symbol and convert to float
-            return float(re.sub(r'[^\d.]', '', bid_text))
+            return _parse_amount(bid_text)
         
         raise ValueError("Could not extract current bid")
     
@@ -175,7 +321,7 @@ class EbayScraper(BaseScraper):
         Returns:
             Brand string or None if not found
         """
-        brand_elem = soup.find("div", {"class": "it-attr", "data-name": "Brand"})
+        brand_elem = self._item_attributes(soup).get("Brand")
         if brand_elem:
             return brand_elem.find("span", {"class": "attr-value"}).text.strip()
         return None
@@ -189,7 +335,7 @@ class EbayScraper(BaseScraper):
         Returns:
             Model string or None if not found
         """
-        model_elem = soup.find("div", {"class": "it-attr", "data-name": "Model"})
+        model_elem = self._item_attributes(soup).get("Model")
         if model_elem:
             return model_elem.find("span", {"class": "attr-value"}).text.strip()
         return None
@@ -203,7 +349,7 @@ class EbayScraper(BaseScraper):
         Returns:
             UPC string or None if not found
         """
-        upc_elem = soup.find("div", {"class": "it-attr", "data-name": "UPC"})
+        upc_elem = self._item_attributes(soup).get("UPC")
         if upc_elem:
             return upc_elem.find("span", {"class": "attr-value"}).text.strip()
         return None
@@ -217,7 +363,7 @@ class EbayScraper(BaseScraper):
         Returns:
             ASIN string or None if not found
         """
-        asin_elem = soup.find("div", {"class": "it-attr", "data-name": "ASIN"})
+        asin_elem = self._item_attributes(soup).get("ASIN")
         if asin_elem:
             return asin_elem.find("span", {"class": "attr-value"}).text.strip()
         return None
@@ -231,7 +377,7 @@ class EbayScraper(BaseScraper):
         Returns:
             Condition string
         """
-        condition_elem = soup.find("div", {"class": "it-attr", "data-name": "Condition"})
+        condition_elem = self._item_attributes(soup).get("Condition")
         if condition_elem:
             return condition_elem.find("span", {"class": "attr-value"}).text.strip()
         
@@ -246,7 +392,7 @@ class EbayScraper(BaseScraper):
         Returns:
             Damage notes string or None if not found
         """
-        damage_elem = soup.find("div", {"class": "it-attr", "data-name": "Damage"})
+        damage_elem = self._item_attributes(soup).get("Damage")
         if damage_elem:
             return damage_elem.find("span", {"class": "attr-value"}).text.strip()
         return None
@@ -298,7 +444,7 @@ class EbayScraper(BaseScraper):
         shipping_elem = soup.find("div", {"class": "shp-info"})
         if shipping_elem:
             return {
-                "cost": float(re.sub(r'[^\d.]', '', shipping_elem.find("span", {"class": "shp-cost"}).text.strip())),
+                "cost": _parse_amount(shipping_elem.find("span", {"class": "shp-cost"}).text.strip()),
                 "service": shipping_elem.find("span", {"class": "shp-srv"}).text.strip(),
                 "location": shipping_elem.find("span", {"class": "shp-loc"}).text.strip()
             }
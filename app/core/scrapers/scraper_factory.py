@@ -1,5 +1,7 @@
-from typing import Dict, Optional, Type
+from typing import Dict, List, Optional, Type
 import logging
+import threading
+import requests
 from .base_scraper import BaseScraper
 from .ebay_scraper import EbayScraper
 from ..proxy_manager import ProxyManager
@@ -7,12 +9,18 @@ from ..user_agent_manager import UserAgentManager
 
 logger = logging.getLogger(__name__)
 
+# Concurrent scrapes in an async batch
+BATCH_CONCURRENCY = 32
+
 class ScraperFactory:
     """Factory class for creating scraper instances."""
     
     _instances: Dict[str, BaseScraper] = {}
     _proxy_manager: Optional[ProxyManager] = None
     _user_agent_manager: Optional[UserAgentManager] = None
+    _session: Optional[requests.Session] = None
+    _service = None  # ScraperService used by scrape_batch_async
+    _lock = threading.Lock()
     
     @classmethod
     def get_scraper(cls, scraper_type: str) -> BaseScraper:
@@ -27,25 +35,61 @@ class ScraperFactory:
         Raises:
             ValueError: If scraper type is invalid
         """
-        # Initialize managers if needed
-        if cls._proxy_manager is None:
-            cls._proxy_manager = ProxyManager()
-        if cls._user_agent_manager is None:
-            cls._user_agent_manager = UserAgentManager()
-        
-        # Return existing instance if available
-        if scraper_type in cls._instances:
-            return cls._instances[scraper_type]
-        
-        # Create new instance
-        scraper_class = cls._get_scraper_class(scraper_type)
-        if scraper_class:
-            instance = scraper_class(cls._proxy_manager, cls._user_agent_manager)
-            cls._instances[scraper_type] = instance
+        # Return existing instance if available, without locking
+        instance = cls._instances.get(scraper_type)
+        if instance is not None:
             return instance
         
+        with cls._lock:
+            # Another thread may have created it while we waited
+            instance = cls._instances.get(scraper_type)
+            if instance is not None:
+                return instance
+            
+            # Initialize managers if needed
+            if cls._proxy_manager is None:
+                cls._proxy_manager = ProxyManager()
+            if cls._user_agent_manager is None:
+                cls._user_agent_manager = UserAgentManager()
+            
+            # Create new instance
+            scraper_class = cls._get_scraper_class(scraper_type)
+            if scraper_class:
+                instance = scraper_class(cls._proxy_manager, cls._user_agent_manager, cls._session)
+                cls._instances[scraper_type] = instance
+                return instance
+        
         raise ValueError(f"Invalid scraper type: {scraper_type}")
     
+    @classmethod
+    async def scrape_batch_async(cls,
+                                 urls: List[str],
+                                 scraper_type: str = "ebay",
+                                 concurrency: int = BATCH_CONCURRENCY) -> List[Dict]:
+        """Scrape many URLs concurrently with one scraper.
+        
+        Delegates to ScraperService.scrape_by_urls_async, so batches get
+        the same per-host throttling, retries and result cache.
+        
+        Args:
+            urls: Auction URLs to scrape
+            scraper_type: Type of scraper to use
+            concurrency: Maximum number of scrapes in flight
+            
+        Returns:
+            List of dictionaries containing auction data, in input order,
+            with an error entry for each URL that failed
+        """
+        # Imported here; scraper_service imports this module
+        from ..scraper_service import ScraperService
+        
+        with cls._lock:
+            if cls._service is None:
+                cls._service = ScraperService()
+            service = cls._service
+        
+        return await service.scrape_by_urls_async(urls, scraper_type, concurrency=concurrency)
+    
     @classmethod
     def _get_scraper_class(cls, scraper_type: str) -> Optional[Type[BaseScraper]]:
         """Get the scraper class for a given type.
@@ -74,7 +118,8 @@ class ScraperFactory:
     @classmethod
     def clear_instances(cls) -> None:
         """Clear all scraper instances."""
-        cls._instances.clear()
+        with cls._lock:
+            cls._instances.clear()
     
     @classmethod
     def set_proxy_manager(cls, proxy_manager: ProxyManager) -> None:
@@ -92,4 +137,13 @@ class ScraperFactory:
         Args:
             user_agent_manager: User agent manager instance
         """
-        cls._user_agent_manager = user_agent_manager 
\ No newline at end of file
+        cls._user_agent_manager = user_agent_manager
+    
+    @classmethod
+    def set_session(cls, session: requests.Session) -> None:
+        """Set the HTTP session shared by new scraper instances.
+        
+        Args:
+            session: HTTP session instance
+        """
+        cls._session = session 
\ No newline at end of file
@@ -67,6 +67,47 @@ def research_product(upc: Optional[str] = None,
     finally:
         db.close()
 
+@shared_task
+def research_products(products: List[Dict]) -> List[Dict]:
+    """Celery task to research several products in one batch.
+    
+    Args:
+        products: List of dictionaries with optional upc, brand, model,
+            category, asin and ebay_id keys
+        
+    Returns:
+        List of research results in the same order as products
+    """
+    research_service = ResearchService()
+    db = next(get_db())
+    
+    try:
+        # Research products
+        results = research_service.research_products(products)
+        
+        # Log research
+        for product, result in zip(products, results):
+            db.add(ResearchLog(
+                upc=product.get("upc"),
+                brand=product.get("brand"),
+                model=product.get("model"),
+                category=product.get("category"),
+                asin=product.get("asin"),
+                ebay_id=product.get("ebay_id"),
+                data=result,
+                created_at=datetime.utcnow()
+            ))
+        db.commit()
+        
+        return results
+        
+    except Exception as e:
+        logger.error(f"Batch product research failed: {e}")
+        raise
+    
+    finally:
+        db.close()
+
 @shared_task
 def train_models(price_data: List[Dict], return_data: List[Dict]) -> Dict:
     """Celery task to train research models.
@@ -0,0 +1,56 @@
+import shutil
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("sklearn")
+pytest.importorskip("treelite")
+pytest.importorskip("tl2cgen")
+
+from app.core.research.ml_models import ReturnRiskPredictor
+
+
+@pytest.fixture
+def training_data():
+    """Small return risk training set with both outcomes."""
+    rng = np.random.default_rng(0)
+    n = 200
+    data = pd.DataFrame({
+        "product_type_encoded": rng.integers(0, 1000, n),
+        "condition_encoded": rng.integers(0, 1000, n),
+        "seller_rating": rng.uniform(0, 5, n),
+        "description_length": rng.integers(0, 2000, n),
+        "has_damage_notes": rng.integers(0, 2, n),
+        "has_returns_accepted": rng.integers(0, 2, n),
+    })
+    data["returned"] = (data["has_damage_notes"] & (data["seller_rating"] < 2.5)).astype(int)
+    return data
+
+
+@pytest.mark.skipif(shutil.which("gcc") is None, reason="compiling the model needs gcc")
+def test_return_risk_predicts_through_compiled_model(tmp_path, training_data):
+    predictor = ReturnRiskPredictor()
+    predictor.model_path = tmp_path / "return_risk.joblib"
+    predictor.scaler_path = tmp_path / "return_risk_scaler.joblib"
+    predictor.lib_path = tmp_path / "return_risk.so"
+
+    predictor.train(training_data)
+    assert predictor.tl_predictor is not None
+
+    features = [
+        {"product_type": "toy", "condition": "used", "seller_rating": 1.0,
+         "description": "box damage", "returns_accepted": True},
+        {"product_type": "tool", "condition": "new", "seller_rating": 4.8,
+         "description": "sealed", "returns_accepted": False},
+    ]
+    X_scaled = predictor._scale_features(predictor._prepare_features_batch(features))
+    expected = predictor.model.predict_proba(X_scaled)[:, 1]
+
+    categories, probabilities = predictor.predict_batch(features)
+    np.testing.assert_allclose(probabilities, expected, atol=1e-6)
+    assert "Unknown" not in categories
+
+    category, probability = predictor.predict(features[0])
+    assert category != "Unknown"
+    assert probability == pytest.approx(expected[0], abs=1e-6)